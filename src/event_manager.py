@@ -417,6 +417,7 @@ COMMANDS:
     test infrastructure       Run infrastructure tests
     test scraper              Run specific test (e.g., test_scraper)
     test --verbose            Run tests with verbose output
+    test --jobs N             Run up to N test files in parallel (or --jobs=N)
     
     utils                     List all utility commands
     utils --list              List all utility commands
@@ -2127,7 +2128,7 @@ def cli_resolve_locations(base_path, config, dry_run=False, event_id=None):
         return 0
 
 
-def cli_test(base_path, test_name=None, verbose=False, list_tests=False):
+def cli_test(base_path, test_name=None, verbose=False, list_tests=False, jobs=1):
     """CLI: Run tests
     
     Args:
@@ -2135,13 +2136,14 @@ def cli_test(base_path, test_name=None, verbose=False, list_tests=False):
         test_name: Test category name (core, features, infrastructure) or specific test name to run
         verbose: Enable verbose output
         list_tests: List available tests
+        jobs: Number of test files to run in parallel
         
     Returns:
         Exit code (0 for success, 1 for error)
     """
     from modules.test_runner import TestRunner
     
-    runner = TestRunner(base_path, verbose=verbose)
+    runner = TestRunner(base_path, verbose=verbose, jobs=jobs)
     
     if list_tests:
         runner.list_tests()
@@ -2729,12 +2731,25 @@ def _execute_command(args, base_path, config):
         # Parse test arguments
         verbose = '--verbose' in args.args if args.args else False
         list_tests = '--list' in args.args if args.args else False
-        
-        # Filter out flags to get the actual test/category name
-        test_args = [arg for arg in (args.args or []) if not arg.startswith('--')]
+        jobs = 1
+        test_args = []
+        remaining = iter(args.args or [])
+        for arg in remaining:
+            # Accept both --jobs N (as test_runner.py does) and --jobs=N
+            if arg == '--jobs' or arg.startswith('--jobs='):
+                value = arg.split('=', 1)[1] if '=' in arg else next(remaining, None)
+                try:
+                    jobs = int(value)
+                except (TypeError, ValueError):
+                    print(f"❌ --jobs expects a number, got: {value or 'nothing'}")
+                    return 1
+            elif not arg.startswith('--'):
+                # Non-flag arguments are the actual test/category name
+                test_args.append(arg)
         test_name = test_args[0] if test_args else None
         
-        return cli_test(base_path, test_name=test_name, verbose=verbose, list_tests=list_tests)
+        return cli_test(base_path, test_name=test_name, verbose=verbose,
+                        list_tests=list_tests, jobs=jobs)
     
     if command == 'utils':
         # Delegate to utility runner module (KISS: keep main CLI simple)
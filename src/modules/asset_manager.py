@@ -24,6 +24,21 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
+def _sha256_of_file(f) -> str:
+    """
+    Hash an open binary file with SHA256.
+    
+    Uses hashlib.file_digest (Python 3.11+), which hashes straight from the
+    file buffer in C, and falls back to a chunked read loop otherwise.
+    """
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    sha256_hash = hashlib.sha256()
+    for byte_block in iter(lambda: f.read(65536), b""):
+        sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
 class AssetManager:
     """Manages CDN asset versions, checksums, and updates"""
     
@@ -100,13 +115,9 @@ class AssetManager:
         Returns:
             SHA256 checksum as hex string
         """
-        sha256_hash = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                # Read file in chunks for memory efficiency
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+                return _sha256_of_file(f)
         except Exception as e:
             logger.error(f"Failed to calculate checksum for {file_path}: {e}")
             return ""
@@ -176,12 +187,7 @@ class AssetManager:
         """
         file_path = self.dependencies_dir / file_dest
         
-        # Check if file exists
-        if not file_path.exists():
-            logger.debug(f"Asset file not found: {file_dest}")
-            return False
-        
-        # Find stored checksum
+        # Find stored checksum (cheap dict lookup, no filesystem access)
         stored_checksum = None
         for package_name, package_data in self.versions_data["assets"].items():
             if file_dest in package_data.get("files", {}):
@@ -192,8 +198,18 @@ class AssetManager:
             logger.debug(f"No stored checksum for {file_dest}")
             return False
         
-        # Calculate current checksum and compare
-        current_checksum = self._calculate_checksum(file_path)
+        # Calculate current checksum and compare; opening the file doubles
+        # as the existence check, so no separate stat() is needed
+        try:
+            with open(file_path, "rb") as f:
+                current_checksum = _sha256_of_file(f)
+        except FileNotFoundError:
+            logger.debug(f"Asset file not found: {file_dest}")
+            return False
+        except OSError as e:
+            logger.error(f"Failed to calculate checksum for {file_path}: {e}")
+            return False
+        
         is_valid = current_checksum == stored_checksum
         
         if not is_valid:
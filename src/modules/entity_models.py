@@ -7,12 +7,78 @@ All dataclasses for the entity system:
 - Helper functions (ID generation, validation)
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, Union, get_args, get_origin
 import re
+import sys
 
 
-@dataclass
+def _is_container_type(tp) -> bool:
+    """True if a field annotation is a list/dict type (possibly Optional)"""
+    origin = get_origin(tp)
+    if origin is Union:
+        return any(_is_container_type(arg) for arg in get_args(tp))
+    return tp in (list, dict) or origin in (list, dict)
+
+
+def _codegen_serde(cls=None, *, intern_fields=()):
+    """
+    Generate specialized to_dict()/from_dict() methods for a dataclass.
+    
+    Like dataclasses does for __init__, the method bodies are built as source
+    with every field name hard-coded, so the per-call work is plain attribute
+    access and dict operations instead of field reflection. List/dict fields
+    are deep-copied so callers never alias the entity's containers.
+    
+    String values of intern_fields (names, addresses - repeated across many
+    events) are passed through sys.intern() in from_dict().
+    """
+    if cls is None:
+        return lambda cls: _codegen_serde(cls, intern_fields=intern_fields)
+    
+    field_list = fields(cls)
+    
+    to_dict_lines = ['def to_dict(self):', '    data = {}']
+    from_dict_lines = ['def from_dict(cls, data):', '    kwargs = {}']
+    for f in field_list:
+        value = 'deepcopy(value)' if _is_container_type(f.type) else 'value'
+        to_dict_lines += [
+            f'    value = self.{f.name}',
+            '    if value is not None:',
+            f'        data[{f.name!r}] = {value}',
+        ]
+        if f.name in intern_fields:
+            from_dict_lines += [
+                f'    if {f.name!r} in data:',
+                f'        value = data[{f.name!r}]',
+                f'        kwargs[{f.name!r}] = intern(value) if type(value) is str else value',
+            ]
+        else:
+            from_dict_lines += [
+                f'    if {f.name!r} in data:',
+                f'        kwargs[{f.name!r}] = data[{f.name!r}]',
+            ]
+    to_dict_lines.append('    return data')
+    from_dict_lines.append('    return cls(**kwargs)')
+    
+    namespace = {'deepcopy': deepcopy, 'intern': sys.intern}
+    exec('\n'.join(to_dict_lines + [''] + from_dict_lines), namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f'{cls.__qualname__}.to_dict'
+    to_dict.__doc__ = 'Convert to dictionary, excluding None values'
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = f'{cls.__qualname__}.from_dict'
+    from_dict.__doc__ = f'Create {cls.__name__} from dictionary (unknown keys are ignored)'
+    
+    cls.to_dict = to_dict
+    cls.from_dict = classmethod(from_dict)
+    return cls
+
+
+@_codegen_serde(intern_fields=('name', 'address', 'category'))
+@dataclass(slots=True)
 class Location:
     """Verified location entity"""
     id: str
@@ -34,18 +100,11 @@ class Location:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        data = asdict(self)
-        return {k: v for k, v in data.items() if v is not None}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Location':
-        """Create Location from dictionary"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+    # to_dict() and from_dict() are generated by _codegen_serde
 
 
-@dataclass
+@_codegen_serde(intern_fields=('name', 'address'))
+@dataclass(slots=True)
 class Organizer:
     """Verified organizer entity"""
     id: str
@@ -65,15 +124,7 @@ class Organizer:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        data = asdict(self)
-        return {k: v for k, v in data.items() if v is not None}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Organizer':
-        """Create Organizer from dictionary"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+    # to_dict() and from_dict() are generated by _codegen_serde
 
 
 def generate_location_id(name: str) -> str:
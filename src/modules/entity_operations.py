@@ -19,12 +19,30 @@ import shutil
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime, timezone
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .entity_models import generate_location_id, generate_organizer_id, Location, Organizer
 
 logger = logging.getLogger(__name__)
 
+# Reference pattern lookup tables keyed by
+# (has *_id, has *_override, has embedded dict) so each event is classified
+# with three membership tests and one dict lookup instead of a branch chain
+_LOCATION_PATTERNS = {
+    (has_id, has_override, has_embedded): (
+        ('partial_override' if has_override else 'reference_only') if has_id
+        else ('full_override' if has_embedded else 'needs_migration')
+    )
+    for has_id in (False, True)
+    for has_override in (False, True)
+    for has_embedded in (False, True)
+}
+_ORGANIZER_PATTERNS = {
+    # No organizer at all is valid, so it counts as reference_only
+    key: ('reference_only' if pattern == 'needs_migration' else pattern)
+    for key, pattern in _LOCATION_PATTERNS.items()
+}
+
 
 class EntityOperations:
     """
@@ -183,14 +201,22 @@ class EntityOperations:
             else:
                 events = data.get('pending_events', [])
             
-            for event in events:
-                results['total_events'] += 1
+            # Classify every event once, then count patterns in bulk
+            location_patterns = [self._classify_location_pattern(e) for e in events]
+            organizer_patterns = [self._classify_organizer_pattern(e) for e in events]
+            results['total_events'] += len(events)
+            for pattern, count in Counter(location_patterns).items():
+                results['location_patterns'][pattern] += count
+            for pattern, count in Counter(organizer_patterns).items():
+                results['organizer_patterns'][pattern] += count
+            
+            # Collect details for everything that isn't a clean reference
+            for event, location_pattern, organizer_pattern in zip(
+                    events, location_patterns, organizer_patterns):
+                if location_pattern == 'reference_only' and organizer_pattern == 'reference_only':
+                    continue
                 event_id = event.get('id', 'unknown')
                 
-                # Analyze location pattern
-                location_pattern = self._classify_location_pattern(event)
-                results['location_patterns'][location_pattern] += 1
-                
                 if location_pattern == 'partial_override':
                     results['partial_overrides'].append({
                         'event_id': event_id,
@@ -214,10 +240,6 @@ class EntityOperations:
                         'reason': 'No location_id or embedded location'
                     })
                 
-                # Analyze organizer pattern
-                organizer_pattern = self._classify_organizer_pattern(event)
-                results['organizer_patterns'][organizer_pattern] += 1
-                
                 if organizer_pattern == 'partial_override':
                     results['partial_overrides'].append({
                         'event_id': event_id,
@@ -235,33 +257,19 @@ class EntityOperations:
     
     def _classify_location_pattern(self, event: dict) -> str:
         """Classify location reference pattern"""
-        has_location_id = 'location_id' in event
-        has_location_override = 'location_override' in event
-        has_embedded_location = 'location' in event and isinstance(event['location'], dict)
-        
-        if has_location_id and has_location_override:
-            return 'partial_override'
-        elif has_location_id and not has_location_override:
-            return 'reference_only'
-        elif has_embedded_location and not has_location_id:
-            return 'full_override'
-        else:
-            return 'needs_migration'
+        return _LOCATION_PATTERNS[(
+            'location_id' in event,
+            'location_override' in event,
+            isinstance(event.get('location'), dict),
+        )]
     
     def _classify_organizer_pattern(self, event: dict) -> str:
         """Classify organizer reference pattern"""
-        has_organizer_id = 'organizer_id' in event
-        has_organizer_override = 'organizer_override' in event
-        has_embedded_organizer = 'organizer' in event and isinstance(event['organizer'], dict)
-        
-        if has_organizer_id and has_organizer_override:
-            return 'partial_override'
-        elif has_organizer_id and not has_organizer_override:
-            return 'reference_only'
-        elif has_embedded_organizer and not has_organizer_id:
-            return 'full_override'
-        else:
-            return 'reference_only'  # No organizer is valid
+        return _ORGANIZER_PATTERNS[(
+            'organizer_id' in event,
+            'organizer_override' in event,
+            isinstance(event.get('organizer'), dict),
+        )]
     
     def validate_references(self) -> Dict[str, Any]:
         """
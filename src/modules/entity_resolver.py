@@ -10,14 +10,32 @@ This allows events to share common locations while supporting event-specific
 customizations when needed (e.g., VIP entrance, temporary stage).
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from copy import deepcopy
 
+from .utils import read_json
+
 logger = logging.getLogger(__name__)
 
+# Event fields replaced by resolve_event() with resolved entities
+_ENTITY_FIELDS = frozenset(('location', 'organizer'))
+
+
+def _copy_json(value):
+    """
+    Deep-copy JSON data (dicts, lists, scalars).
+    
+    Library entities come straight from JSON, so this skips deepcopy()'s
+    memo and type dispatch.
+    """
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
 
 class EntityResolver:
     """
@@ -27,6 +45,9 @@ class EntityResolver:
         resolver = EntityResolver(base_path)
         resolved_event = resolver.resolve_event(event)
         resolved_events = resolver.resolve_events(events)
+        
+        # Or with already-loaded libraries (no file I/O)
+        resolver = EntityResolver.from_dicts(locations, organizers)
     """
     
     def __init__(self, base_path: Path):
@@ -41,8 +62,37 @@ class EntityResolver:
         self.organizers_file = self.base_path / 'assets' / 'json' / 'organizers.json'
         
         # Load libraries
-        self.locations = self._load_locations()
-        self.organizers = self._load_organizers()
+        self._set_libraries(self._load_locations(), self._load_organizers())
+    
+    @classmethod
+    def from_dicts(cls, locations: List[dict], organizers: List[dict],
+                   base_path: Optional[Path] = None) -> 'EntityResolver':
+        """
+        Create a resolver from already-loaded library entries.
+        
+        Args:
+            locations: Location dicts (the 'locations' list of locations.json)
+            organizers: Organizer dicts (the 'organizers' list of organizers.json)
+            base_path: Optional repository root path
+            
+        Returns:
+            EntityResolver using the given entries as-is (resolved results are
+            still copies, so the entries are never modified)
+        """
+        resolver = cls.__new__(cls)
+        resolver.base_path = Path(base_path) if base_path else None
+        resolver.locations_file = None
+        resolver.organizers_file = None
+        resolver._set_libraries(
+            {loc['id']: loc for loc in locations},
+            {org['id']: org for org in organizers}
+        )
+        return resolver
+    
+    def _set_libraries(self, locations: Dict[str, dict], organizers: Dict[str, dict]):
+        """Install ID-keyed libraries and reset caches and statistics"""
+        self.locations = locations
+        self.organizers = organizers
         
         # Track usage statistics
         self.stats = {
@@ -61,11 +111,10 @@ class EntityResolver:
             return {}
         
         try:
-            with open(self.locations_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                locations = data.get('locations', [])
-                # Convert list to dict keyed by ID for fast lookup
-                return {loc['id']: loc for loc in locations}
+            data = read_json(self.locations_file)
+            locations = data.get('locations', [])
+            # Convert list to dict keyed by ID for fast lookup
+            return {loc['id']: loc for loc in locations}
         except Exception as e:
             logger.error(f"Failed to load locations: {e}")
             return {}
@@ -77,11 +126,10 @@ class EntityResolver:
             return {}
         
         try:
-            with open(self.organizers_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                organizers = data.get('organizers', [])
-                # Convert list to dict keyed by ID for fast lookup
-                return {org['id']: org for org in organizers}
+            data = read_json(self.organizers_file)
+            organizers = data.get('organizers', [])
+            # Convert list to dict keyed by ID for fast lookup
+            return {org['id']: org for org in organizers}
         except Exception as e:
             logger.error(f"Failed to load organizers: {e}")
             return {}
@@ -111,6 +159,13 @@ class EntityResolver:
         Returns:
             Resolved location dictionary
         """
+        # Fast path for the common shape: Tier 1 reference, nothing embedded
+        if 'location' not in event and 'location_override' not in event:
+            base_location = self.locations.get(event.get('location_id'))
+            if base_location:
+                self.stats['location_tier1'] += 1
+                return _copy_json(base_location)
+        
         # Tier 3: Full override (embedded location)
         if 'location' in event and isinstance(event['location'], dict):
             if 'lat' in event['location'] and 'lon' in event['location']:
@@ -139,17 +194,14 @@ class EntityResolver:
         # Tier 1: Reference only (no override)
         if 'location_override' not in event:
             self.stats['location_tier1'] += 1
-            return deepcopy(base_location)
+            return _copy_json(base_location)
         
         # Tier 2: Partial override
         self.stats['location_tier2'] += 1
-        resolved = deepcopy(base_location)
-        override = event['location_override']
+        resolved = _copy_json(base_location)
         
         # Merge override fields into base
-        for key, value in override.items():
-            resolved[key] = value
-        
+        resolved.update(event['location_override'])
         return resolved
     
     def resolve_event_organizer(self, event: dict) -> Optional[dict]:
@@ -164,6 +216,13 @@ class EntityResolver:
         Returns:
             Resolved organizer dictionary or None
         """
+        # Fast path for the common shape: Tier 1 reference, nothing embedded
+        if 'organizer' not in event and 'organizer_override' not in event:
+            base_organizer = self.organizers.get(event.get('organizer_id'))
+            if base_organizer:
+                self.stats['organizer_tier1'] += 1
+                return _copy_json(base_organizer)
+        
         # Tier 3: Full override (embedded organizer)
         if 'organizer' in event and isinstance(event['organizer'], dict):
             if 'name' in event['organizer']:
@@ -191,17 +250,14 @@ class EntityResolver:
         # Tier 1: Reference only (no override)
         if 'organizer_override' not in event:
             self.stats['organizer_tier1'] += 1
-            return deepcopy(base_organizer)
+            return _copy_json(base_organizer)
         
         # Tier 2: Partial override
         self.stats['organizer_tier2'] += 1
-        resolved = deepcopy(base_organizer)
-        override = event['organizer_override']
+        resolved = _copy_json(base_organizer)
         
         # Merge override fields into base
-        for key, value in override.items():
-            resolved[key] = value
-        
+        resolved.update(event['organizer_override'])
         return resolved
     
     def resolve_event(self, event: dict, clean_refs: bool = True) -> dict:
@@ -215,7 +271,13 @@ class EntityResolver:
         Returns:
             Fully resolved event with embedded entities
         """
-        resolved = deepcopy(event)
+        # Copy everything except the entity fields, which are replaced by
+        # their resolved (already copied) versions below. Keys keep their
+        # original order.
+        resolved = {
+            key: None if key in _ENTITY_FIELDS else deepcopy(value)
+            for key, value in event.items()
+        }
         
         # Resolve location
         resolved['location'] = self.resolve_event_location(event)
@@ -224,6 +286,8 @@ class EntityResolver:
         organizer = self.resolve_event_organizer(event)
         if organizer:
             resolved['organizer'] = organizer
+        elif 'organizer' in event:
+            resolved['organizer'] = deepcopy(event['organizer'])
         
         # Clean up reference fields if requested
         if clean_refs:
@@ -9,6 +9,9 @@ Supports three execution modes:
 - CLI Mode: Non-interactive, scriptable (default)
 - TUI Mode: Interactive menu-driven interface (--tui)
 - Daemon Mode: Continuous monitoring with file watching (--daemon)
+
+Code pattern results are cached in .verify_cache.json and reused while a
+file's mtime and size are unchanged; pass --no-cache to re-check everything.
 """
 
 import json
@@ -17,8 +20,34 @@ import re
 import sys
 import time
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Optional: orjson parses JSON several times faster than the stdlib json
+# module. This script also runs standalone, so it carries its own fallback.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 19+ digit runs may be integers outside 64 bits, which orjson reads as floats
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+
+def _loads(raw):
+    """
+    Parse JSON bytes like json.loads(), using orjson where it gives the same
+    result (it rejects NaN/Infinity and rounds integers beyond 64 bits).
+    """
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 class FeatureVerifier:
     """Verifies presence of documented features in codebase"""
@@ -26,10 +55,20 @@ class FeatureVerifier:
     # Default value for 'implemented' field in features.json
     DEFAULT_IMPLEMENTED = True
     
-    def __init__(self, repo_root=None, verbose=False):
+    # Features are independent and mostly wait on file I/O
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
+    # Pattern results kept between runs, keyed by file mtime + size
+    CACHE_FILENAME = ".verify_cache.json"
+    # Bump when a change to pattern matching invalidates stored results
+    CACHE_VERSION = 1
+    
+    def __init__(self, repo_root=None, verbose=False, use_cache=False):
         self.verbose = verbose
+        self.use_cache = use_cache
         self.repo_root = Path(repo_root) if repo_root else Path.cwd()
         self.features_file = self.repo_root / "features.json"
+        self.cache_file = self.repo_root / self.CACHE_FILENAME
         self.results = {
             "total": 0,
             "passed": 0,
@@ -37,11 +76,41 @@ class FeatureVerifier:
             "skipped": 0,
             "features": []
         }
+        # Per-thread log buffer, so parallel features don't interleave output
+        self._log_local = threading.local()
+        # Registry path -> repo_root / path; features share many files
+        self._resolved_paths = {}
+        self._reset_caches()
+    
+    def _reset_caches(self):
+        """Forget file contents cached during a verification run"""
+        # Worker threads may fill the same entry twice; the values are
+        # identical and single dict operations are atomic, so no locking
+        # Parsed JSON config per path (None if missing or invalid)
+        self._config_cache = {}
+        # Set of key paths (tuples) per config path, see _config_key_paths()
+        self._config_keys_cache = {}
+        # Source text per path, or the exception raised while reading it
+        self._source_cache = {}
+        # Compiled regex per pattern string, or the exception it raised
+        self._pattern_cache = {}
+        # (found, reason) per (file, pattern) - features share checks
+        self._search_results = {}
+        # {entry name: is symlink} per directory, None if it can't be listed
+        self._dir_entries = {}
+        # Entries read from the on-disk cache, and those used this run
+        self._stored_results = {}
+        self._result_cache = {}
     
     def log(self, message, level="INFO"):
         """Log message if verbose mode is enabled"""
         if self.verbose:
-            print(f"[{level}] {message}")
+            line = f"[{level}] {message}"
+            buffer = getattr(self._log_local, 'buffer', None)
+            if buffer is not None:
+                buffer.append(line)
+            else:
+                print(line)
     
     def load_features(self):
         """Load feature registry from features.json"""
@@ -49,13 +118,38 @@ class FeatureVerifier:
             print(f"ERROR: Feature registry not found at {self.features_file}")
             sys.exit(1)
         
-        with open(self.features_file, 'r') as f:
-            return json.load(f)
+        return _loads(self.features_file.read_bytes())
+    
+    def _list_dir(self, dir_path):
+        """List a directory once per run (None if it can't be listed)"""
+        if dir_path not in self._dir_entries:
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = {entry.name: entry.is_symlink() for entry in it}
+            except OSError:
+                entries = None
+            self._dir_entries[dir_path] = entries
+        return self._dir_entries[dir_path]
+    
+    def _path_exists(self, full_path):
+        """Path.exists(), answered from the parent's listing when possible"""
+        entries = self._list_dir(full_path.parent)
+        # A listed non-symlink entry exists; anything else (symlinks, "..",
+        # case-insensitive matches) gets the real stat
+        if entries is not None and entries.get(full_path.name) is False:
+            return True
+        return full_path.exists()
+    
+    def _resolve(self, file_path):
+        """Join a registry path onto the repo root (memoized)"""
+        full_path = self._resolved_paths.get(file_path)
+        if full_path is None:
+            full_path = self._resolved_paths[file_path] = self.repo_root / file_path
+        return full_path
     
     def _check_single_file(self, file_path):
         """Check if a single file exists"""
-        full_path = self.repo_root / file_path
-        return full_path.exists()
+        return self._path_exists(self._resolve(file_path))
     
     def check_files_exist(self, feature):
         """Check if all required files exist"""
@@ -65,22 +159,150 @@ class FeatureVerifier:
         missing = [f for f in feature['files'] if not self._check_single_file(f)]
         return len(missing) == 0, missing
     
+    def _read_source(self, full_path):
+        """Read a source file once per run (returns the exception on failure)"""
+        if full_path not in self._source_cache:
+            try:
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    self._source_cache[full_path] = f.read()
+            except Exception as e:
+                self._source_cache[full_path] = e
+        return self._source_cache[full_path]
+    
+    @staticmethod
+    def _literal_alternatives(pattern_str):
+        """
+        Split a pattern made only of literal alternatives ("foo|bar\\.baz")
+        into its plain strings; None if it uses any other regex syntax.
+        """
+        branches = []
+        current = []
+        chars = iter(pattern_str)
+        for char in chars:
+            if char == '\\':
+                escaped = next(chars, None)
+                # \d, \b, \1, ... are classes/anchors/backrefs, not literals
+                if escaped is None or escaped.isalnum():
+                    return None
+                current.append(escaped)
+            elif char == '|':
+                branches.append(''.join(current))
+                current = []
+            elif char in '.^$*+?{}[]()':
+                return None
+            else:
+                current.append(char)
+        branches.append(''.join(current))
+        return tuple(branches)
+    
+    def _compile_pattern(self, pattern_str):
+        """
+        Compile a pattern once per run (returns the exception on failure).
+        
+        Literal alternatives come back as a tuple of strings, checked with
+        substring search instead of the regex engine.
+        """
+        if pattern_str not in self._pattern_cache:
+            literals = self._literal_alternatives(pattern_str)
+            if literals is not None:
+                self._pattern_cache[pattern_str] = literals
+            else:
+                try:
+                    self._pattern_cache[pattern_str] = re.compile(pattern_str)
+                except Exception as e:
+                    self._pattern_cache[pattern_str] = e
+        return self._pattern_cache[pattern_str]
+    
     def _search_pattern_in_file(self, file_path, pattern_str):
-        """Search for a pattern in a file"""
-        full_path = self.repo_root / file_path
-        if not full_path.exists():
+        """Search for a pattern in a file (each file/pattern pair is scanned once)"""
+        key = (file_path, pattern_str)
+        result = self._search_results.get(key)
+        if result is None:
+            result = self._search_results[key] = self._scan_file_for_pattern(file_path, pattern_str)
+        return result
+    
+    def _load_result_cache(self):
+        """Read pattern results stored by a previous run (if caching is on)"""
+        if not self.use_cache:
+            return
+        try:
+            data = _loads(self.cache_file.read_bytes())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.CACHE_VERSION:
+            files = data.get('files')
+            if isinstance(files, dict):
+                self._stored_results = files
+    
+    def _save_result_cache(self):
+        """Store this run's pattern results (only files checked this run)"""
+        if not self.use_cache:
+            return
+        data = {'version': self.CACHE_VERSION, 'files': self._result_cache}
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            tmp_file.write_text(json.dumps(data), encoding='utf-8')
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.log(f"Could not write {self.cache_file}: {e}", "WARNING")
+    
+    def _cached_results_for(self, file_path, full_path):
+        """
+        Pattern results for a file that are still valid, as a dict that new
+        results get added to; None if the file can't be stat'ed.
+        """
+        entry = self._result_cache.get(file_path)
+        if entry is None:
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                return None
+            stamp = [st.st_mtime_ns, st.st_size]
+            stored = self._stored_results.get(file_path)
+            results = {}
+            if (isinstance(stored, dict) and stored.get('stamp') == stamp
+                    and isinstance(stored.get('results'), dict)):
+                results = dict(stored['results'])
+            entry = self._result_cache.setdefault(file_path, {'stamp': stamp, 'results': results})
+        return entry['results']
+    
+    def _scan_file_for_pattern(self, file_path, pattern_str):
+        """Scan a file for a pattern (reusing the on-disk cache when enabled)"""
+        full_path = self._resolve(file_path)
+        if not self._path_exists(full_path):
             return False, "file not found"
         
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            pattern = re.compile(pattern_str)
-            if pattern.search(content):
-                return True, None
-            return False, "pattern not found"
-        except Exception as e:
-            return False, f"error reading file: {e}"
+        if not self.use_cache:
+            return self._match_pattern(full_path, pattern_str)
+        
+        results = self._cached_results_for(file_path, full_path)
+        if results is None:
+            return self._match_pattern(full_path, pattern_str)
+        
+        cached = results.get(pattern_str)
+        if isinstance(cached, list) and len(cached) == 2:
+            return cached[0], cached[1]
+        found, reason = self._match_pattern(full_path, pattern_str)
+        results[pattern_str] = [found, reason]
+        return found, reason
+    
+    def _match_pattern(self, full_path, pattern_str):
+        """Match a pattern against an existing file's content"""
+        content = self._read_source(full_path)
+        if isinstance(content, Exception):
+            return False, f"error reading file: {content}"
+        
+        pattern = self._compile_pattern(pattern_str)
+        if isinstance(pattern, Exception):
+            return False, f"error reading file: {pattern}"
+        
+        if isinstance(pattern, tuple):
+            found = any(literal in content for literal in pattern)
+        else:
+            found = pattern.search(content) is not None
+        if found:
+            return True, None
+        return False, "pattern not found"
     
     def check_code_patterns(self, feature):
         """Check if code patterns exist in specified files"""
@@ -88,12 +310,13 @@ class FeatureVerifier:
             return True, []
         
         missing = []
+        search = self._search_pattern_in_file
         for pattern_def in feature['code_patterns']:
             file_path = pattern_def['file']
             pattern = pattern_def['pattern']
             desc = pattern_def.get('description', pattern)
             
-            found, reason = self._search_pattern_in_file(file_path, pattern)
+            found, reason = search(file_path, pattern)
             if not found:
                 missing.append({
                     'file': file_path,
@@ -104,26 +327,41 @@ class FeatureVerifier:
         
         return len(missing) == 0, missing
     
+    def _load_config(self, full_path):
+        """Load a JSON config file once per run (None if missing or invalid)"""
+        if full_path not in self._config_cache:
+            config = None
+            if full_path.exists():
+                try:
+                    config = _loads(full_path.read_bytes())
+                except Exception:
+                    pass
+            self._config_cache[full_path] = config
+        return self._config_cache[full_path]
+    
+    def _config_key_paths(self, full_path):
+        """
+        All key paths of a config file as tuples, e.g. ('map',) and
+        ('map', 'center'), built once per run. Only objects are descended
+        into, and tuples keep keys that themselves contain dots distinct.
+        """
+        if full_path not in self._config_keys_cache:
+            paths = set()
+            stack = [((), self._load_config(full_path))]
+            while stack:
+                prefix, value = stack.pop()
+                if isinstance(value, dict):
+                    for k, child in value.items():
+                        path = prefix + (k,)
+                        paths.add(path)
+                        stack.append((path, child))
+            self._config_keys_cache[full_path] = paths
+        return self._config_keys_cache[full_path]
+    
     def _check_config_key_in_file(self, config_file, key):
         """Check if a config key exists in a JSON file"""
-        full_path = self.repo_root / config_file
-        if not full_path.exists():
-            return False
-        
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            # Support nested keys like "map.center"
-            keys = key.split('.')
-            value = config
-            for k in keys:
-                if not isinstance(value, dict) or k not in value:
-                    return False
-                value = value[k]
-            return True
-        except Exception:
-            return False
+        # Support nested keys like "map.center"
+        return tuple(key.split('.')) in self._config_key_paths(self._resolve(config_file))
     
     def check_config_keys(self, feature):
         """Check if required config keys exist"""
@@ -204,14 +442,10 @@ class FeatureVerifier:
         
         return result
     
-    def verify_all(self):
-        """Verify all features from the registry"""
-        data = self.load_features()
-        features = data.get('features', [])
-        
-        self.results['total'] = len(features)
-        
-        for feature in features:
+    def _verify_feature_buffered(self, feature):
+        """Verify or skip one feature, returning (result, buffered log lines)"""
+        self._log_local.buffer = []
+        try:
             # Skip features that are not implemented
             if not feature.get('implemented', self.DEFAULT_IMPLEMENTED):
                 self.log(f"Skipping feature: {feature.get('name', 'Unknown')} (not implemented)")
@@ -222,77 +456,103 @@ class FeatureVerifier:
                     'status': 'skipped',
                     'checks': []
                 }
-                self.results['features'].append(result)
-                self.results['skipped'] += 1
-                continue
-            
-            result = self.verify_feature(feature)
-            self.results['features'].append(result)
-            
-            if result['status'] == 'passed':
-                self.results['passed'] += 1
             else:
-                self.results['failed'] += 1
+                result = self.verify_feature(feature)
+            return result, self._log_local.buffer
+        finally:
+            self._log_local.buffer = None
+    
+    def verify_all(self):
+        """Verify all features from the registry"""
+        # Files may have changed since the last run (TUI / daemon mode)
+        self._reset_caches()
+        self._load_result_cache()
+        data = self.load_features()
+        features = data.get('features', [])
+        
+        self.results['total'] = len(features)
         
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # map() yields in registry order, so results and log output stay
+            # in the same order as a serial run
+            for result, log_lines in executor.map(self._verify_feature_buffered, features):
+                if log_lines:
+                    print("\n".join(log_lines))
+                self.results['features'].append(result)
+                
+                if result['status'] == 'skipped':
+                    self.results['skipped'] += 1
+                elif result['status'] == 'passed':
+                    self.results['passed'] += 1
+                else:
+                    self.results['failed'] += 1
+        
+        self._save_result_cache()
         return self.results
     
     def print_summary(self, results):
         """Print human-readable summary"""
-        print("=" * 60)
-        print("Feature Verification Summary")
-        print("=" * 60)
+        # Collected and written in one go rather than line by line
+        lines = []
+        out = lines.append
+        out("=" * 60)
+        out("Feature Verification Summary")
+        out("=" * 60)
         
         skipped_count = results.get('skipped', 0)
         
-        print(f"\nTotal Features: {results['total']}")
-        print(f"Passed: {results['passed']}")
-        print(f"Failed: {results['failed']}")
-        print(f"Skipped (Not Implemented): {skipped_count}")
+        out(f"\nTotal Features: {results['total']}")
+        out(f"Passed: {results['passed']}")
+        out(f"Failed: {results['failed']}")
+        out(f"Skipped (Not Implemented): {skipped_count}")
         
         if skipped_count > 0:
-            print("\nSkipped features (not implemented):")
+            out("\nSkipped features (not implemented):")
             skipped_features = [f for f in results['features'] if f['status'] == 'skipped']
             for feature in skipped_features:
-                print(f"  ⊝ {feature['name']} ({feature['id']})")
+                out(f"  ⊝ {feature['name']} ({feature['id']})")
         
         if results['failed'] > 0:
-            print("\nFailed features:")
+            out("\nFailed features:")
             for feature in results['features']:
                 if feature['status'] != 'failed':
                     continue
                 
-                print(f"\n  ✗ {feature['name']} ({feature['id']})")
+                out(f"\n  ✗ {feature['name']} ({feature['id']})")
                 for check in feature['checks']:
                     if check['passed']:
                         continue
                     
-                    print(f"    - {check['type']}: FAILED")
+                    out(f"    - {check['type']}: FAILED")
                     
                     if 'missing_files' in check and check['missing_files']:
                         for f in check['missing_files']:
-                            print(f"      Missing file: {f}")
+                            out(f"      Missing file: {f}")
                     
                     if 'missing_patterns' in check and check['missing_patterns']:
                         for p in check['missing_patterns']:
-                            print(f"      Missing pattern: {p['description']}")
-                            print(f"        in {p['file']}: {p['reason']}")
+                            out(f"      Missing pattern: {p['description']}")
+                            out(f"        in {p['file']}: {p['reason']}")
                     
                     if 'missing_keys' in check and check['missing_keys']:
                         for k in check['missing_keys']:
-                            print(f"      Missing config key: {k}")
+                            out(f"      Missing config key: {k}")
         
-        print("=" * 60)
+        out("=" * 60)
         
         if results['failed'] == 0:
             if skipped_count > 0:
-                print(f"\n✓ All implemented features verified successfully!")
-                print(f"  ({skipped_count} feature(s) marked as not implemented)")
+                out(f"\n✓ All implemented features verified successfully!")
+                out(f"  ({skipped_count} feature(s) marked as not implemented)")
             else:
-                print("\n✓ All features verified successfully!")
-            return 0
+                out("\n✓ All features verified successfully!")
+            exit_code = 0
         else:
-            print(f"\n✗ {results['failed']} feature(s) failed verification")
-            return 1
+            out(f"\n✗ {results['failed']} feature(s) failed verification")
+            exit_code = 1
+        
+        print("\n".join(lines))
+        return exit_code
 
 
 def run_tui(verifier):
@@ -489,6 +749,11 @@ def main():
         action="store_true",
         help="Output results in JSON format"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-check every pattern instead of reusing {FeatureVerifier.CACHE_FILENAME}"
+    )
     parser.add_argument(
         "--repo-root",
         type=str,
@@ -522,7 +787,8 @@ def main():
     # Initialize verifier
     verifier = FeatureVerifier(
         repo_root=args.repo_root,
-        verbose=args.verbose
+        verbose=args.verbose,
+        use_cache=not args.no_cache
     )
     
     # Launch appropriate mode
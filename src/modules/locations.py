@@ -25,11 +25,13 @@ Usage:
 import json
 import logging
 import os
+from copy import deepcopy
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
 from .entity_models import Location, generate_location_id
+from .utils import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,12 @@ class LocationManager:
         """
         self.base_path = Path(base_path)
         self.locations_file = self.base_path / 'assets' / 'json' / 'locations.json'
+        
+        # Lowercased (name, address, location) tuples for search_locations(),
+        # rebuilt when locations.json changes (keyed by mtime + size)
+        self._search_index = []
+        self._search_index_key = None
+        
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
@@ -58,18 +66,29 @@ class LocationManager:
                 '_version': '1.0',
                 'locations': []
             }
-            with open(self.locations_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(self.locations_file, data)
     
     def _load_data(self) -> dict:
         """Load locations.json"""
-        with open(self.locations_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(self.locations_file)
     
     def _save_data(self, data: dict):
         """Save locations.json"""
-        with open(self.locations_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(self.locations_file, data)
+        self._search_index_key = None
+    
+    def _get_search_index(self) -> list:
+        """Get (name_lower, address_lower, location dict) tuples for all locations"""
+        stat = self.locations_file.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._search_index_key:
+            locations = self._load_data().get('locations', [])
+            self._search_index = [
+                (loc.get('name', '').lower(), loc.get('address', '').lower(), loc)
+                for loc in locations
+            ]
+            self._search_index_key = key
+        return self._search_index
     
     def add_location(self, location: Location) -> str:
         """
@@ -205,18 +224,13 @@ class LocationManager:
             List of matching Location objects
         """
         query_lower = query.lower()
-        data = self._load_data()
-        locations = data.get('locations', [])
         
-        results = []
-        for loc in locations:
-            name = loc.get('name', '').lower()
-            address = loc.get('address', '').lower()
-            
-            if query_lower in name or query_lower in address:
-                results.append(Location.from_dict(loc))
-        
-        return results
+        # Copy matches so callers can't mutate the cached index
+        return [
+            Location.from_dict(deepcopy(loc))
+            for name, address, loc in self._get_search_index()
+            if query_lower in name or query_lower in address
+        ]
     
     def verify_location(self, location_id: str, verified_by: str = None):
         """
@@ -291,10 +305,17 @@ class LocationManager:
         data = self._load_data()
         locations = data.get('locations', [])
         
-        verified_count = sum(1 for loc in locations if loc.get('verified', False))
-        with_address = sum(1 for loc in locations if loc.get('address'))
-        with_phone = sum(1 for loc in locations if loc.get('phone'))
-        with_website = sum(1 for loc in locations if loc.get('website'))
+        # Single pass over the library instead of one pass per counter
+        verified_count = with_address = with_phone = with_website = 0
+        for loc in locations:
+            if loc.get('verified', False):
+                verified_count += 1
+            if loc.get('address'):
+                with_address += 1
+            if loc.get('phone'):
+                with_phone += 1
+            if loc.get('website'):
+                with_website += 1
         
         return {
             'total_locations': len(locations),
@@ -30,6 +30,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
 from .entity_models import Organizer, generate_organizer_id
+from .utils import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -58,18 +59,15 @@ class OrganizerManager:
                 '_version': '1.0',
                 'organizers': []
             }
-            with open(self.organizers_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(self.organizers_file, data)
     
     def _load_data(self) -> dict:
         """Load organizers.json"""
-        with open(self.organizers_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(self.organizers_file)
     
     def _save_data(self, data: dict):
         """Save organizers.json"""
-        with open(self.organizers_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(self.organizers_file, data)
     
     def add_organizer(self, organizer: Organizer) -> str:
         """
@@ -111,17 +111,16 @@ class EventScraper:
         with open(status_file, 'w') as f:
             json.dump(status, f, indent=2)
     
-    def _write_pending_count(self):
+    def _write_pending_count(self, pending_count=None):
         """
         Update pending count in events.json
         This allows frontend to read pending count from the same file it already loads
+        
+        Args:
+            pending_count: Known pending event count (re-read from disk if None)
         """
         from .utils import update_pending_count_in_events
-        update_pending_count_in_events(self.base_path)
-        
-        # Get the count for logging
-        pending_data = load_pending_events(self.base_path)
-        pending_count = len(pending_data.get('pending_events', []))
+        pending_count = update_pending_count_in_events(self.base_path, pending_count)
         logger.info(f"Updated pending count in events.json: {pending_count} events")
     
     def scrape_all_sources(self):
@@ -271,7 +270,7 @@ class EventScraper:
         )
         
         # Write pending count JSON for frontend notifications
-        self._write_pending_count()
+        self._write_pending_count(len(pending_data['pending_events']))
         
         return new_events
         
@@ -14,21 +14,29 @@ RELATIVE_OFFSETS = [
     ('heute', 0)
 ]
 
+# All relative phrases in one precompiled alternation (listed in priority
+# order), so the text is scanned once instead of once per phrase
+_RELATIVE_OFFSET_BY_PHRASE = dict(RELATIVE_OFFSETS)
+_RELATIVE_PRIORITY = {phrase: i for i, (phrase, _) in enumerate(RELATIVE_OFFSETS)}
+_RELATIVE_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(phrase) for phrase, _ in RELATIVE_OFFSETS) + r')\b'
+)
+
 
 def resolve_relative_date(text: str, base_date: Optional[datetime] = None) -> Optional[datetime]:
     """Resolve relative date expressions like 'tomorrow' into a date."""
     if not text:
         return None
     
-    text_lower = text.lower()
-    base_date = base_date or datetime.now()
-    
-    for phrase, offset in RELATIVE_OFFSETS:
-        if re.search(rf'\b{re.escape(phrase)}\b', text_lower):
-            target = base_date + timedelta(days=offset)
-            return datetime(target.year, target.month, target.day)
+    found = [match.group(1) for match in _RELATIVE_RE.finditer(text.lower())]
+    if not found:
+        return None
     
-    return None
+    # Several phrases may occur; the earliest one in RELATIVE_OFFSETS wins
+    phrase = min(found, key=_RELATIVE_PRIORITY.__getitem__)
+    base_date = base_date or datetime.now()
+    target = base_date + timedelta(days=_RELATIVE_OFFSET_BY_PHRASE[phrase])
+    return datetime(target.year, target.month, target.day)
 
 
 def extract_time_from_text(text: str) -> Optional[Tuple[int, int]]:
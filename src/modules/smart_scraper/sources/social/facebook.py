@@ -13,7 +13,8 @@ from __future__ import annotations
 
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pathlib import Path
-from datetime import datetime, timedelta
+from calendar import monthrange
+from datetime import datetime, timedelta, MINYEAR, MAXYEAR
 from urllib.parse import urljoin, urlparse, parse_qs
 import re
 import json
@@ -43,6 +44,50 @@ except ImportError:
     IMAGE_ANALYZER_AVAILABLE = False
 
 
+# Event keywords (German + English) counted by _has_event_indicators()
+_EVENT_KEYWORDS = (
+    # German
+    'veranstaltung', 'konzert', 'live', 'party', 'festival',
+    'ausstellung', 'vernissage', 'lesung', 'workshop', 'theater',
+    'eintritt', 'einlass', 'beginn', 'uhr', 'tickets',
+    'kommt vorbei', 'wir laden ein', 'freuen uns',
+    # English
+    'event', 'concert', 'show', 'exhibition', 'opening',
+    'admission', 'entry', 'doors', 'tickets', 'join us',
+)
+_HAS_DATE_RE = re.compile(r'\d{1,2}\.\d{1,2}\.(\d{4}|\d{2})?')
+_HAS_TIME_RE = re.compile(r'\d{1,2}[:.]\d{2}\s*(?:uhr)?|\d{1,2}\s*uhr')
+
+# Date patterns tried in order by _extract_datetime_from_text()
+_TEXT_DATE_PATTERNS = (
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})'), 'DMY4'),
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)'), 'DMY2'),
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), 'YMD'),
+    (re.compile(r'(\d{1,2})\.(\d{1,2})(?:\.(?!\d)|$)'), 'DM'),
+)
+_DMY_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})')
+_DM_RE = re.compile(r'(\d{1,2})\.(\d{1,2})(?:\.(?!\d)|$)')
+
+_STORY_FBID_RE = re.compile(r'story_fbid=(\d+)')
+_POSTS_ID_RE = re.compile(r'/posts/(\d+)')
+_PERMALINK_ID_RE = re.compile(r'story_fbid=(\d+)|id=(\d+)')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SOCIAL_ARTIFACTS_RE = re.compile(r'See more|Mehr anzeigen|·|\u200b')
+
+
+def _format_naive_iso(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """Format date/time parts like datetime(...).isoformat() without building a datetime.
+    
+    Raises:
+        ValueError: If the date parts don't form a valid calendar date
+    """
+    if not (MINYEAR <= year <= MAXYEAR and 1 <= month <= 12
+            and 1 <= day <= monthrange(year, month)[1]):
+        raise ValueError(f"invalid date: {year}-{month}-{day}")
+    return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:00"
+
+
 class FacebookSource(BaseSource):
     """Facebook events scraper using web scraping (no API required).
     
@@ -77,6 +122,8 @@ class FacebookSource(BaseSource):
         self.scan_posts = bool(options_config.get('scan_posts', False))
         self.force_scan = bool(options_config.get('force_scan', False))
         self.post_cache = self._init_post_cache()
+        # Reference "now" for relative dates, fixed once per scrape() run
+        self._batch_now: Optional[datetime] = None
         
         # Initialize session with realistic headers to avoid detection
         if self.available:
@@ -131,6 +178,7 @@ class FacebookSource(BaseSource):
         
         events = []
         direct_scraping_failed = False
+        self._batch_now = datetime.now()
         
         # Determine the type of URL and scrape accordingly
         url_type = self._detect_url_type(self.url)
@@ -601,17 +649,17 @@ class FacebookSource(BaseSource):
             href = link['href']
             # Extract from story_fbid parameter
             if 'story_fbid=' in href:
-                match = re.search(r'story_fbid=(\d+)', href)
+                match = _STORY_FBID_RE.search(href)
                 if match:
                     return match.group(1)
             # Extract from posts/ URL pattern
             if '/posts/' in href:
-                match = re.search(r'/posts/(\d+)', href)
+                match = _POSTS_ID_RE.search(href)
                 if match:
                     return match.group(1)
             # Extract from permalink.php
             if 'permalink.php' in href:
-                match = re.search(r'story_fbid=(\d+)|id=(\d+)', href)
+                match = _PERMALINK_ID_RE.search(href)
                 if match:
                     return match.group(1) or match.group(2)
         
@@ -661,24 +709,12 @@ class FacebookSource(BaseSource):
         
         text_lower = text.lower()
         
-        # Event keywords (German + English)
-        event_keywords = [
-            # German
-            'veranstaltung', 'konzert', 'live', 'party', 'festival',
-            'ausstellung', 'vernissage', 'lesung', 'workshop', 'theater',
-            'eintritt', 'einlass', 'beginn', 'uhr', 'tickets',
-            'kommt vorbei', 'wir laden ein', 'freuen uns',
-            # English
-            'event', 'concert', 'show', 'exhibition', 'opening',
-            'admission', 'entry', 'doors', 'tickets', 'join us',
-        ]
-        
         # Check for keywords
-        keyword_count = sum(1 for kw in event_keywords if kw in text_lower)
+        keyword_count = sum(1 for kw in _EVENT_KEYWORDS if kw in text_lower)
         
         # Check for date/time patterns
-        has_date = bool(re.search(r'\d{1,2}\.\d{1,2}\.(\d{4}|\d{2})?', text))
-        has_time = bool(re.search(r'\d{1,2}[:.]\d{2}\s*(?:uhr)?|\d{1,2}\s*uhr', text_lower))
+        has_date = bool(_HAS_DATE_RE.search(text))
+        has_time = bool(_HAS_TIME_RE.search(text_lower))
         
         return keyword_count >= 2 or (keyword_count >= 1 and (has_date or has_time))
     
@@ -917,11 +953,14 @@ class FacebookSource(BaseSource):
             print(f"      AI extraction error: {e}")
             return None
     
-    def _extract_datetime_from_text(self, text: str) -> Optional[str]:
+    def _extract_datetime_from_text(self, text: str,
+                                    base_now: Optional[datetime] = None) -> Optional[str]:
         """Extract datetime from text.
         
         Args:
             text: Text to analyze
+            base_now: Reference time for relative dates and missing years
+                (defaults to the current scrape's batch time, else now)
             
         Returns:
             ISO formatted datetime or None
@@ -929,26 +968,20 @@ class FacebookSource(BaseSource):
         if not text:
             return None
         
-        # Date patterns
-        date_patterns = [
-            (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', 'DMY4'),
-            (r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)', 'DMY2'),
-            (r'(\d{4})-(\d{2})-(\d{2})', 'YMD'),
-            (r'(\d{1,2})\.(\d{1,2})(?:\.(?!\d)|$)', 'DM'),
-        ]
+        base_now = base_now or self._batch_now or datetime.now()
         
         date_match = None
         date_format = None
         
-        for pattern, fmt in date_patterns:
-            match = re.search(pattern, text)
+        for pattern, fmt in _TEXT_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_match = match
                 date_format = fmt
                 break
         
         if not date_match:
-            relative_date = resolve_relative_date(text)
+            relative_date = resolve_relative_date(text, base_now)
             if not relative_date:
                 return None
             
@@ -957,8 +990,8 @@ class FacebookSource(BaseSource):
             if time_match:
                 hour, minute = time_match
             
-            dt = datetime(relative_date.year, relative_date.month, relative_date.day, hour, minute)
-            return dt.isoformat()
+            return _format_naive_iso(relative_date.year, relative_date.month,
+                                     relative_date.day, hour, minute)
         
         # Parse date
         try:
@@ -969,7 +1002,7 @@ class FacebookSource(BaseSource):
                 day, month, year = int(groups[0]), int(groups[1]), 2000 + int(groups[2])
             elif date_format == 'DM':
                 day, month = int(groups[0]), int(groups[1])
-                year = resolve_year_for_date(month, day)
+                year = resolve_year_for_date(month, day, base_now)
             else:  # YMD
                 year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
             
@@ -979,8 +1012,7 @@ class FacebookSource(BaseSource):
             if time_match:
                 hour, minute = time_match
             
-            dt = datetime(year, month, day, hour, minute)
-            return dt.isoformat()
+            return _format_naive_iso(year, month, day, hour, minute)
             
         except (ValueError, IndexError):
             return None
@@ -1011,7 +1043,7 @@ class FacebookSource(BaseSource):
                 return dt.isoformat()
             
             # DD.MM.YYYY or DD.MM.YY
-            match = re.match(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})', date_str)
+            match = _DMY_RE.match(date_str)
             if match:
                 day = int(match.group(1))
                 month = int(match.group(2))
@@ -1020,7 +1052,7 @@ class FacebookSource(BaseSource):
                     year += 2000
             
             if not all([day, month, year]):
-                match = re.match(r'(\d{1,2})\.(\d{1,2})(?:\.(?!\d)|$)', date_str)
+                match = _DM_RE.match(date_str)
                 if match:
                     day = int(match.group(1))
                     month = int(match.group(2))
@@ -1082,9 +1114,9 @@ class FacebookSource(BaseSource):
             return ''
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         # Remove common social media artifacts
-        text = re.sub(r'See more|Mehr anzeigen|·|\u200b', '', text)
+        text = _SOCIAL_ARTIFACTS_RE.sub('', text)
         return text.strip()
     
     def _scrape_via_web_search(self) -> List[Dict[str, Any]]:
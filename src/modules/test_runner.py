@@ -8,8 +8,9 @@ Provides category-based test organization and flexible execution options.
 
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional
 
 
 class TestRunner:
@@ -21,6 +22,7 @@ class TestRunner:
     - Run individual tests
     - Verbose/quiet output modes
     - Test listing functionality
+    - Parallel execution of test files (jobs > 1)
     """
     
     # Test organization by category
@@ -63,17 +65,19 @@ class TestRunner:
         'test_filters': 'filter_tester',
     }
     
-    def __init__(self, base_path: Path, verbose: bool = False):
+    def __init__(self, base_path: Path, verbose: bool = False, jobs: int = 1):
         """Initialize test runner
         
         Args:
             base_path: Repository root path
             verbose: Enable verbose output
+            jobs: Number of test files to run concurrently (1 = sequential)
         """
         self.base_path = Path(base_path)
         self.tests_dir = self.base_path / 'tests'
         self.modules_dir = self.base_path / 'src' / 'modules'
         self.verbose = verbose
+        self.jobs = max(1, jobs)
     
     def _resolve_test_file(self, test_name: str) -> Path:
         """Resolve test file path, checking both tests/ and src/modules/
@@ -170,10 +174,8 @@ class TestRunner:
         print("=" * 70)
         
         results = []
-        for test_name in tests:
-            test_file = self._resolve_test_file(test_name)
-            
-            if not test_file.exists():
+        for test_name, test_file, result in self._run_tests(tests):
+            if result is None:
                 print(f"\n⚠ Skipping '{test_name}' (file not found)")
                 results.append({
                     'name': test_name,
@@ -182,7 +184,7 @@ class TestRunner:
                 })
                 continue
             
-            result = self._run_test_file(test_file)
+            self._report_result(test_file, result)
             result['name'] = test_name
             results.append(result)
         
@@ -200,35 +202,66 @@ class TestRunner:
         
         all_results = []
         
-        for category in ['core', 'features', 'infrastructure']:
-            print(f"\n{'=' * 70}")
-            print(f"Category: {category.upper()}")
-            print('=' * 70)
+        categories = ['core', 'features', 'infrastructure']
+        test_categories = [
+            (test_name, category)
+            for category in categories
+            for test_name in self.TEST_CATEGORIES[category]
+        ]
+        
+        # Tests of all categories share one pool; headers are printed in order
+        current_category = None
+        outcomes = self._run_tests([test_name for test_name, _ in test_categories])
+        for (test_name, test_file, result), (_, category) in zip(outcomes, test_categories):
+            if category != current_category:
+                current_category = category
+                print(f"\n{'=' * 70}")
+                print(f"Category: {category.upper()}")
+                print('=' * 70)
             
-            tests = self.TEST_CATEGORIES[category]
+            if result is None:
+                print(f"\n⚠ Skipping '{test_name}' (file not found)")
+                all_results.append({
+                    'name': test_name,
+                    'category': category,
+                    'success': False,
+                    'skipped': True
+                })
+                continue
             
-            for test_name in tests:
-                test_file = self._resolve_test_file(test_name)
-                
-                if not test_file.exists():
-                    print(f"\n⚠ Skipping '{test_name}' (file not found)")
-                    all_results.append({
-                        'name': test_name,
-                        'category': category,
-                        'success': False,
-                        'skipped': True
-                    })
-                    continue
-                
-                result = self._run_test_file(test_file)
-                result['name'] = test_name
-                result['category'] = category
-                all_results.append(result)
+            self._report_result(test_file, result)
+            result['name'] = test_name
+            result['category'] = category
+            all_results.append(result)
         
         return self._print_summary(all_results, 'all')['success']
     
+    def _run_tests(self, test_names: List[str]) -> Iterator[tuple]:
+        """Run test files, in parallel when jobs > 1
+        
+        Args:
+            test_names: Names of the tests to run
+            
+        Yields:
+            (test_name, test_file, result) in input order; result is None
+            if the test file doesn't exist
+        """
+        test_files = [self._resolve_test_file(test_name) for test_name in test_names]
+        
+        def execute(test_file: Path) -> Optional[Dict]:
+            return self._execute_test_file(test_file) if test_file.exists() else None
+        
+        if self.jobs == 1:
+            for test_name, test_file in zip(test_names, test_files):
+                yield test_name, test_file, execute(test_file)
+            return
+        
+        # Test files run as subprocesses, so threads are enough to overlap them
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            yield from zip(test_names, test_files, executor.map(execute, test_files))
+    
     def _run_test_file(self, test_file: Path) -> Dict:
-        """Run a single test file
+        """Run a single test file and print its outcome
         
         Args:
             test_file: Path to test file
@@ -236,6 +269,19 @@ class TestRunner:
         Returns:
             Dictionary with test result
         """
+        result = self._execute_test_file(test_file)
+        self._report_result(test_file, result)
+        return result
+    
+    def _execute_test_file(self, test_file: Path) -> Dict:
+        """Run a single test file without printing anything
+        
+        Args:
+            test_file: Path to test file
+            
+        Returns:
+            Dictionary with test result ('error' is set if the run itself failed)
+        """
         try:
             # Run test with appropriate verbosity
             cmd = [sys.executable, str(test_file)]
@@ -251,20 +297,6 @@ class TestRunner:
                 timeout=60  # 60 second timeout per test
             )
             
-            # Print output if verbose or if test failed
-            if self.verbose or result.returncode != 0:
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr:
-                    print(result.stderr, file=sys.stderr)
-            else:
-                # In quiet mode, just show pass/fail
-                test_name = test_file.stem
-                if result.returncode == 0:
-                    print(f"  ✓ {test_name}")
-                else:
-                    print(f"  ✗ {test_name}")
-            
             return {
                 'success': result.returncode == 0,
                 'returncode': result.returncode,
@@ -274,24 +306,49 @@ class TestRunner:
             }
             
         except subprocess.TimeoutExpired:
-            print(f"\n✗ Test timed out after 60 seconds")
             return {
                 'success': False,
                 'returncode': -1,
                 'stdout': '',
                 'stderr': 'Test timed out',
-                'skipped': False
+                'skipped': False,
+                'error': "Test timed out after 60 seconds"
             }
         except Exception as e:
-            print(f"\n✗ Error running test: {e}")
             return {
                 'success': False,
                 'returncode': -1,
                 'stdout': '',
                 'stderr': str(e),
-                'skipped': False
+                'skipped': False,
+                'error': f"Error running test: {e}"
             }
     
+    def _report_result(self, test_file: Path, result: Dict):
+        """Print the outcome of a test file run
+        
+        Args:
+            test_file: Path to test file
+            result: Result from _execute_test_file()
+        """
+        if 'error' in result:
+            print(f"\n✗ {result['error']}")
+            return
+        
+        # Print output if verbose or if test failed
+        if self.verbose or result['returncode'] != 0:
+            if result['stdout']:
+                print(result['stdout'])
+            if result['stderr']:
+                print(result['stderr'], file=sys.stderr)
+        else:
+            # In quiet mode, just show pass/fail
+            test_name = test_file.stem
+            if result['returncode'] == 0:
+                print(f"  ✓ {test_name}")
+            else:
+                print(f"  ✗ {test_name}")
+    
     def _print_summary(self, results: List[Dict], scope: str) -> Dict:
         """Print test results summary
         
@@ -359,13 +416,15 @@ def main():
                        help='List all available tests')
     parser.add_argument('--verbose', action='store_true',
                        help='Enable verbose output')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of test files to run in parallel (default: 1)')
     
     args = parser.parse_args()
     
     # Get repository root (go up two levels from src/modules/)
     base_path = Path(__file__).parent.parent.parent
     
-    runner = TestRunner(base_path, verbose=args.verbose)
+    runner = TestRunner(base_path, verbose=args.verbose, jobs=args.jobs)
     
     # List tests
     if args.list:
@@ -3,9 +3,26 @@
 import json
 import logging
 import os
+import re
 from pathlib import Path
 from datetime import datetime
 
+# Optional: orjson parses/serializes JSON in C, several times faster than
+# the stdlib json module. Everything falls back to json when it's missing.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: ijson iterates JSON arrays incrementally, so counting pending
+# events doesn't need the whole queue in memory.
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -289,11 +306,60 @@ def load_config(base_path):
     return config
 
 
+# 19+ digit runs may be integers outside 64 bits, which orjson reads as floats
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+
+def read_json(path):
+    """
+    Read and parse a JSON file, using orjson when available.
+    
+    Files orjson can't read like json does go through json.loads(): NaN /
+    Infinity (written by json.dump) raise in orjson, and integers beyond
+    64 bits would lose precision. Parse errors raise json.JSONDecodeError.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if not _LONG_DIGITS_RE.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(raw)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    """
+    Write data as 2-space indented UTF-8 JSON (non-ASCII kept as-is),
+    using orjson when available.
+    
+    The data is serialized before the file is opened, so a serialization
+    error leaves an existing file untouched. orjson output matches
+    json.dump(data, f, indent=2, ensure_ascii=False) except that floats use
+    orjson's exponent form (1e-7, 1e16 instead of 1e-07, 1e+16) and NaN /
+    Infinity are written as null. Data orjson rejects (non-str keys, ints
+    beyond 64 bits) is written with json instead.
+    """
+    payload = None
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            pass
+    if payload is None:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
 def load_events(base_path):
     """Load published events from events.json"""
     events_path = base_path / 'assets' / 'json' / 'events.json'
-    with open(events_path, 'r') as f:
-        return json.load(f)
+    return read_json(events_path)
 
 
 def save_events(base_path, events_data):
@@ -304,32 +370,67 @@ def save_events(base_path, events_data):
         json.dump(events_data, f, indent=2)
 
 
-def update_pending_count_in_events(base_path):
+def update_pending_count_in_events(base_path, pending_count=None):
     """
     Update the pending_count field in events.json
     This allows the frontend to read pending count from the same file it already loads
     
     Note: This does NOT update the last_updated timestamp since it's only metadata,
     not a change to the actual events data.
+    
+    Args:
+        base_path: Repository root path
+        pending_count: Number of pending events, if the caller already knows it
+            (pending_events.json is only read when this is None)
+    
+    Returns:
+        int: The pending count written to events.json
     """
-    pending_data = load_pending_events(base_path)
+    if pending_count is None:
+        pending_count = count_pending_events(base_path)
+    
     events_data = load_events(base_path)
     
+    # Nothing to do if the stored count is already current
+    if events_data.get('pending_count') == pending_count:
+        return pending_count
+    
     # Add or update pending_count field
-    events_data['pending_count'] = len(pending_data.get('pending_events', []))
+    events_data['pending_count'] = pending_count
     
     # Save back to events.json WITHOUT updating timestamp
     events_path = base_path / 'assets' / 'json' / 'events.json'
     with open(events_path, 'w') as f:
         json.dump(events_data, f, indent=2)
+    
+    return pending_count
+
+
+def count_pending_events(base_path):
+    """
+    Count the events in pending_events.json.
+    
+    Streams the file with ijson when installed (constant memory), otherwise
+    loads it like load_pending_events().
+    """
+    if IJSON_AVAILABLE:
+        pending_path = base_path / 'assets' / 'json' / 'pending_events.json'
+        try:
+            with open(pending_path, 'rb') as f:
+                return sum(1 for _ in ijson.items(f, 'pending_events.item'))
+        except (FileNotFoundError, ijson.JSONError):
+            # Missing file (load_pending_events() creates it) or content
+            # ijson rejects but json accepts, e.g. NaN written by json.dump
+            pass
+    
+    return len(load_pending_events(base_path).get('pending_events', []))
 
 
 def load_pending_events(base_path):
     """Load pending events from pending_events.json"""
     pending_path = base_path / 'assets' / 'json' / 'pending_events.json'
     try:
-        with open(pending_path, 'r') as f:
-            return json.load(f)
+        return read_json(pending_path)
     except FileNotFoundError:
         # Create empty pending events file if it doesn't exist
         pending_data = {'pending_events': [], 'last_scraped': None}
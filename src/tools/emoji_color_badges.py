@@ -10,8 +10,27 @@ Usage:
 """
 
 import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Luminance tone ladder on integer luminance (299*R + 587*G + 114*B, i.e.
+# relative luminance scaled by 255000): < 0.08 is black, > 0.95 is white,
+# everything in between is classified by color family.
+_TONE_THRESHOLDS = (20400, 242251)
+_TONE_EMOJI = ('⬛', None, '⬜')
+_MID_LUMINANCE = 127500  # 0.5
+
+# Pattern: ![ALT](data:image/svg+xml,...fill%3D%22%23HEXCODE%22...)
+# The full 'data:image/svg+xml,' prefix is required so the [^)]* scan never
+# runs over base64 PNG/JPEG data URIs, which can't contain a badge.
+_SVG_DATA_URI_PREFIX = 'data:image/svg+xml,'
+_SVG_BADGE_RE = re.compile(r'!\[[^\]]*\]\(data:image/svg\+xml,[^)]*fill%3D%22%23([A-Fa-f0-9]{6})%22[^)]*\)')
+
+# Emoji highlighted in the dry-run preview (one character-class scan per line)
+_EMOJI_PREVIEW_RE = re.compile('[🟣💗🩷💜]')
+
 
 def get_color_emoji(hex_color):
     """
@@ -24,21 +43,20 @@ def get_color_emoji(hex_color):
     Returns:
         Square emoji character representing the color
     """
-    color = hex_color.upper().lstrip('#')
+    color = hex_color[1:] if hex_color[:1] == '#' else hex_color
     
     # Parse RGB
     r = int(color[0:2], 16)
     g = int(color[2:4], 16)
     b = int(color[4:6], 16)
     
-    # Calculate luminance
-    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    # Calculate luminance (integer, see _TONE_THRESHOLDS)
+    luminance = 299 * r + 587 * g + 114 * b
     
     # Very light or very dark - use basic geometric squares
-    if luminance > 0.95:
-        return '⬜'  # White square
-    elif luminance < 0.08:
-        return '⬛'  # Black square
+    tone = _TONE_EMOJI[bisect_right(_TONE_THRESHOLDS, luminance)]
+    if tone:
+        return tone
     
     # Pink/Purple detection (all ecoBarbie colors)
     if r > b and b > g:
@@ -58,7 +76,7 @@ def get_color_emoji(hex_color):
     elif b > r and b > g:
         return '🟦'
     else:
-        return '⬛' if luminance < 0.5 else '⬜'
+        return '⬛' if luminance < _MID_LUMINANCE else '⬜'
 
 
 def replace_with_emoji_badges(content: str) -> str:
@@ -71,66 +89,79 @@ def replace_with_emoji_badges(content: str) -> str:
     Returns:
         Updated content with emoji badges
     """
-    # Pattern: ![ALT](data:image/svg+xml,...fill%3D%22%23HEXCODE%22...)
-    pattern = r'!\[[^\]]*\]\(data:image/svg[^)]*fill%3D%22%23([A-Fa-f0-9]{6})%22[^)]*\)'
+    # Cheap substring check before running the regex at all
+    if _SVG_DATA_URI_PREFIX not in content:
+        return content
+    
+    # Palette documents repeat the same colors, so classify each one once
+    emojis = {}
     
     def replacer(match):
         hex_color = match.group(1)
-        emoji = get_color_emoji(f"#{hex_color}")
+        emoji = emojis.get(hex_color)
+        if emoji is None:
+            emoji = emojis[hex_color] = get_color_emoji(f"#{hex_color}")
         return f"{emoji} `#{hex_color}`"
     
-    return re.sub(pattern, replacer, content)
+    return _SVG_BADGE_RE.sub(replacer, content)
 
 
-def process_markdown_file(file_path: Path, dry_run: bool = False) -> bool:
+def process_markdown_file(file_path: Path, dry_run: bool = False, log: list = None) -> bool:
     """
     Process a markdown file to replace SVG badges with emoji.
     
     Args:
         file_path: Path to markdown file
         dry_run: If True, only show changes without writing
+        log: Optional list collecting status lines. When omitted, the
+            lines are written to stdout in one go before returning.
     
     Returns:
         True if file was modified
     """
-    print(f"\n📄 Processing: {file_path.name}")
-    
-    # Read file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        original_content = f.read()
-    
-    # Replace badges
-    new_content = replace_with_emoji_badges(original_content)
-    
-    # Check if modified
-    if original_content == new_content:
-        print("   ℹ️  No SVG badges found to replace")
-        return False
-    
-    # Count replacements
-    original_count = original_content.count('data:image/svg')
-    new_count = new_content.count('data:image/svg')
-    replaced = original_count - new_count
-    
-    print(f"   ✓ Replaced {replaced} SVG badge(s) with emoji")
-    
-    if dry_run:
-        print("   🔍 DRY RUN - No changes written")
-        # Show first few examples
-        lines = new_content.split('\n')
-        emoji_lines = [l for l in lines if '🟣' in l or '💗' in l or '🩷' in l or '💜' in l][:5]
-        if emoji_lines:
-            print("\n   Preview:")
-            for line in emoji_lines:
-                print(f"      {line.strip()}")
-        return False
-    
-    # Write file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    print("   ✓ File updated")
-    return True
+    out = [] if log is None else log
+    try:
+        out.append(f"\n📄 Processing: {file_path.name}")
+        
+        # Read file
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_content = f.read()
+        
+        # Replace badges
+        new_content = replace_with_emoji_badges(original_content)
+        
+        # Check if modified
+        if original_content == new_content:
+            out.append("   ℹ️  No SVG badges found to replace")
+            return False
+        
+        # Count replacements
+        original_count = original_content.count('data:image/svg')
+        new_count = new_content.count('data:image/svg')
+        replaced = original_count - new_count
+        
+        out.append(f"   ✓ Replaced {replaced} SVG badge(s) with emoji")
+        
+        if dry_run:
+            out.append("   🔍 DRY RUN - No changes written")
+            # Show first few examples
+            lines = new_content.split('\n')
+            emoji_lines = [l for l in lines if _EMOJI_PREVIEW_RE.search(l)][:5]
+            if emoji_lines:
+                out.append("\n   Preview:")
+                for line in emoji_lines:
+                    out.append(f"      {line.strip()}")
+            return False
+        
+        # Write file
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        
+        out.append("   ✓ File updated")
+        return True
+    finally:
+        if log is None:
+            sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -164,15 +195,27 @@ def main():
     print("Processing files...")
     print("=" * 60)
     
+    # Files are independent, so overlap their I/O; each worker keeps its own
+    # log so the output stays grouped per file and in input order
+    def process_with_log(file_path):
+        file_log = []
+        return process_markdown_file(file_path, log=file_log), file_log
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+        results = list(executor.map(process_with_log, existing_files))
+    
+    log = []
     modified_count = 0
-    for file_path in existing_files:
-        if process_markdown_file(file_path):
-            modified_count += 1
+    for modified, file_log in results:
+        log.extend(file_log)
+        modified_count += modified
     
     # Summary
-    print("\n" + "=" * 60)
-    print(f"✅ Complete: {modified_count}/{len(existing_files)} file(s) modified")
-    print("=" * 60)
+    log.append("\n" + "=" * 60)
+    log.append(f"✅ Complete: {modified_count}/{len(existing_files)} file(s) modified")
+    log.append("=" * 60)
+    sys.stdout.write('\n'.join(log) + '\n')
+    sys.stdout.flush()
     
     # Show examples
     print("\n💡 KISS Emoji Examples:")
@@ -187,9 +230,7 @@ def main():
         '#000000',  # Black
     ]
     
-    for color in examples:
-        emoji = get_color_emoji(color)
-        print(f"   {emoji} {color}")
+    sys.stdout.write(''.join(f"   {get_color_emoji(color)} {color}\n" for color in examples))
     
     print("\n   ✓ Super simple!")
     print("   ✓ No external dependencies")
@@ -200,5 +241,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
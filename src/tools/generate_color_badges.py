@@ -13,10 +13,17 @@ Usage:
 
 import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from urllib.parse import quote
 
+# Pre-built <pre> badge templates (with and without a description suffix)
+_PRE_STYLE = 'background-color: {c}; color: {t}; padding: 10px; border-radius: 5px; border: 2px solid #999;'
+_PRE_TEMPLATE_DESC = '<pre style="' + _PRE_STYLE + '"><b>{c}</b> - {d}</pre>'
+_PRE_TEMPLATE_PLAIN = '<pre style="' + _PRE_STYLE + '"><b>{c}</b></pre>'
+
 
 def create_inline_svg_badge(hex_color: str, width: int = 80, height: int = 20) -> str:
     """
@@ -30,8 +37,8 @@ def create_inline_svg_badge(hex_color: str, width: int = 80, height: int = 20) -
     Returns:
         Data URI for inline SVG badge
     """
-    # Remove '#' if present
-    color = hex_color.lstrip('#')
+    # Remove '#' if present ('#' can only be the first character)
+    color = hex_color[1:] if hex_color[:1] == '#' else hex_color
     
     # Create SVG
     svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"><rect width="{width}" height="{height}" fill="#{color}"/></svg>'
@@ -53,7 +60,7 @@ def create_html_kbd_badge(hex_color: str) -> str:
         HTML kbd element
     """
     # Determine text color (white or black) based on background lightness
-    color_without_hash = hex_color.lstrip('#')
+    color_without_hash = hex_color[1:] if hex_color[:1] == '#' else hex_color
     r = int(color_without_hash[0:2], 16)
     g = int(color_without_hash[2:4], 16)
     b = int(color_without_hash[4:6], 16)
@@ -76,7 +83,7 @@ def create_html_pre_badge(hex_color: str, description: str = None) -> str:
     Returns:
         HTML pre element
     """
-    color_without_hash = hex_color.lstrip('#')
+    color_without_hash = hex_color[1:] if hex_color[:1] == '#' else hex_color
     r = int(color_without_hash[0:2], 16)
     g = int(color_without_hash[2:4], 16)
     b = int(color_without_hash[4:6], 16)
@@ -85,11 +92,9 @@ def create_html_pre_badge(hex_color: str, description: str = None) -> str:
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
     text_color = 'black' if luminance > 0.5 else 'white'
     
-    text = f"<b>{hex_color}</b>"
     if description:
-        text += f" - {description}"
-    
-    return f'<pre style="background-color: {hex_color}; color: {text_color}; padding: 10px; border-radius: 5px; border: 2px solid #999;">{text}</pre>'
+        return _PRE_TEMPLATE_DESC.format(c=hex_color, t=text_color, d=description)
+    return _PRE_TEMPLATE_PLAIN.format(c=hex_color, t=text_color)
 
 
 def create_markdown_badge(hex_color: str, alt_text: str = None, style: str = 'svg') -> str:
@@ -137,48 +142,55 @@ def replace_shields_badges(content: str) -> str:
     return re.sub(pattern, replacer, content)
 
 
-def process_markdown_file(file_path: Path, dry_run: bool = False) -> bool:
+def process_markdown_file(file_path: Path, dry_run: bool = False, log: list = None) -> bool:
     """
     Process a markdown file to replace external badges.
     
     Args:
         file_path: Path to markdown file
         dry_run: If True, only show changes without writing
+        log: Optional list collecting status lines. When omitted, the
+            lines are written to stdout in one go before returning.
     
     Returns:
         True if file was modified
     """
-    print(f"\n📄 Processing: {file_path.name}")
-    
-    # Read file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        original_content = f.read()
-    
-    # Replace badges
-    new_content = replace_shields_badges(original_content)
-    
-    # Check if modified
-    if original_content == new_content:
-        print("   ℹ️  No changes needed")
-        return False
-    
-    # Count replacements
-    original_count = original_content.count('img.shields.io')
-    new_count = new_content.count('img.shields.io')
-    replaced = original_count - new_count
-    
-    print(f"   ✓ Replaced {replaced} external badge(s) with inline SVG")
-    
-    if dry_run:
-        print("   🔍 DRY RUN - No changes written")
-        return False
-    
-    # Write file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    print("   ✓ File updated")
-    return True
+    out = [] if log is None else log
+    try:
+        out.append(f"\n📄 Processing: {file_path.name}")
+        
+        # Read file
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_content = f.read()
+        
+        # Replace badges
+        new_content = replace_shields_badges(original_content)
+        
+        # Check if modified
+        if original_content == new_content:
+            out.append("   ℹ️  No changes needed")
+            return False
+        
+        # Count replacements
+        original_count = original_content.count('img.shields.io')
+        new_count = new_content.count('img.shields.io')
+        replaced = original_count - new_count
+        
+        out.append(f"   ✓ Replaced {replaced} external badge(s) with inline SVG")
+        
+        if dry_run:
+            out.append("   🔍 DRY RUN - No changes written")
+            return False
+        
+        # Write file
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        
+        out.append("   ✓ File updated")
+        return True
+    finally:
+        if log is None:
+            sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -213,15 +225,27 @@ def main():
     print("Processing files...")
     print("=" * 60)
     
+    # Files are independent, so overlap their I/O; each worker keeps its own
+    # log so the output stays grouped per file and in input order
+    def process_with_log(file_path):
+        file_log = []
+        return process_markdown_file(file_path, log=file_log), file_log
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+        results = list(executor.map(process_with_log, existing_files))
+    
+    log = []
     modified_count = 0
-    for file_path in existing_files:
-        if process_markdown_file(file_path):
-            modified_count += 1
+    for modified, file_log in results:
+        log.extend(file_log)
+        modified_count += modified
     
     # Summary
-    print("\n" + "=" * 60)
-    print(f"✅ Complete: {modified_count}/{len(existing_files)} file(s) modified")
-    print("=" * 60)
+    log.append("\n" + "=" * 60)
+    log.append(f"✅ Complete: {modified_count}/{len(existing_files)} file(s) modified")
+    log.append("=" * 60)
+    sys.stdout.write('\n'.join(log) + '\n')
+    sys.stdout.flush()
     
     # Show example
     print("\n💡 Example inline badge:")
@@ -237,5 +261,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
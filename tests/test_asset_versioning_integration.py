@@ -25,11 +25,12 @@ from modules.site_generator import SiteGenerator
 class TestAssetVersioningIntegration(unittest.TestCase):
     """Integration tests for asset version tracking"""
     
-    def setUp(self):
-        """Set up test fixtures with temporary directory"""
+    @staticmethod
+    def create_workspace():
+        """Create a temporary repo copy and a SiteGenerator for it"""
         # Create temporary directory for test isolation
-        self.test_dir = tempfile.mkdtemp()
-        self.base_path = Path(self.test_dir)
+        test_dir = tempfile.mkdtemp()
+        base_path = Path(test_dir)
         
         # Copy necessary files from real repo to temp dir
         real_repo = Path(__file__).parent.parent
@@ -37,30 +38,50 @@ class TestAssetVersioningIntegration(unittest.TestCase):
         # Copy config.json if it exists
         config_file = real_repo / 'config.json'
         if config_file.exists():
-            shutil.copy(config_file, self.base_path / 'config.json')
+            shutil.copy(config_file, base_path / 'config.json')
         
         # Create assets directory structure
-        (self.base_path / 'assets' / 'json').mkdir(parents=True, exist_ok=True)
+        (base_path / 'assets' / 'json').mkdir(parents=True, exist_ok=True)
         
         # Initialize generator with temp base path
-        self.generator = SiteGenerator(self.base_path)
+        return test_dir, SiteGenerator(base_path)
     
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up shared test fixtures with temporary directory.
+        
+        The generator is built and dependencies are fetched (mocked) once for
+        the whole class; tests only read the shared state. Tests that change
+        the generator build their own with create_workspace().
+        """
+        cls.test_dir, cls.generator = cls.create_workspace()
+        cls.base_path = Path(cls.test_dir)
+        
+        # Tracked assets before anything is fetched
+        cls.fresh_assets = (cls.generator.asset_manager.list_all_assets()
+                            if cls.generator.asset_manager else [])
+        
+        # Fetch dependencies once (mocked, won't actually download)
+        print("\n=== Setup: Fetch Dependencies (Mocked) ===")
+        with patch('modules.site_generator.SiteGenerator.fetch_file_from_url',
+                   return_value=True):
+            cls.fetch_result = cls.generator.fetch_all_dependencies()
+        
+        cls.assets = (cls.generator.asset_manager.list_all_assets()
+                      if cls.generator.asset_manager else [])
+    
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary test directory"""
-        if self.test_dir and Path(self.test_dir).exists():
-            shutil.rmtree(self.test_dir)
+        if cls.test_dir and Path(cls.test_dir).exists():
+            shutil.rmtree(cls.test_dir)
     
-    @patch('modules.site_generator.SiteGenerator.fetch_file_from_url')
-    def test_workflow_fetch_check_info(self, mock_fetch):
+    def test_workflow_fetch_check_info(self):
         """Test complete workflow: fetch → check → info"""
-        # Mock successful file fetch
-        mock_fetch.return_value = True
-        
-        # Step 1: Fetch dependencies (mocked, won't actually download)
-        print("\n=== Step 1: Fetch Dependencies (Mocked) ===")
-        result = self.generator.fetch_all_dependencies()
+        # Step 1: Dependencies were fetched (mocked) in setUpClass
         # Note: Will fail since files don't actually exist, but that's OK for isolation test
-        self.assertIsInstance(result, bool)
+        self.assertIsInstance(self.fetch_result, bool)
         
         # Step 2: Check dependencies (will show missing, which is expected)
         print("\n=== Step 2: Check Dependencies ===")
@@ -70,13 +91,16 @@ class TestAssetVersioningIntegration(unittest.TestCase):
         # Step 3: Show asset info (even if empty)
         print("\n=== Step 3: Show Asset Info ===")
         if self.generator.asset_manager:
-            assets = self.generator.asset_manager.list_all_assets()
-            self.assertIsInstance(assets, list)
+            self.assertIsInstance(self.assets, list)
     
     @patch('modules.site_generator.SiteGenerator.fetch_file_from_url')
     def test_update_check_when_up_to_date(self, mock_fetch):
         """Test update check when dependencies are up to date"""
-        if not self.generator.asset_manager:
+        # check_for_updates() changes generator state, so use a fresh one
+        test_dir, generator = self.create_workspace()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        
+        if not generator.asset_manager:
             self.skipTest("AssetManager not available")
         
         print("\n=== Test: Update Check (Mocked) ===")
@@ -85,7 +109,7 @@ class TestAssetVersioningIntegration(unittest.TestCase):
         mock_fetch.return_value = True
         
         # Check for updates (will check untracked assets)
-        updates = self.generator.check_for_updates(quiet=True)
+        updates = generator.check_for_updates(quiet=True)
         
         # Should return dict with package info
         self.assertIsInstance(updates, dict)
@@ -115,11 +139,9 @@ class TestAssetVersioningIntegration(unittest.TestCase):
         
         print("\n=== Test: Asset Integrity Verification ===")
         
-        # Get tracked assets (should be empty in fresh temp dir)
-        assets = self.generator.asset_manager.list_all_assets()
-        
-        # Should return a list (even if empty)
-        self.assertIsInstance(assets, list)
+        # Tracked assets listed before the fetch (empty in fresh temp dir)
+        # Should be a list (even if empty)
+        self.assertIsInstance(self.fresh_assets, list)
 
 
 if __name__ == '__main__':
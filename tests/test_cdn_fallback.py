@@ -21,11 +21,12 @@ from modules.utils import load_config
 class TestCDNFallback(unittest.TestCase):
     """Test CDN fallback functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.base_path = Path(__file__).parent.parent
-        self.config = load_config(self.base_path)
-        self.generator = SiteGenerator(self.base_path)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for all tests"""
+        cls.base_path = Path(__file__).parent.parent
+        cls.config = load_config(cls.base_path)
+        cls.generator = SiteGenerator(cls.base_path)
     
     def test_dependencies_fetch(self):
         """Test that dependencies can be fetched or are already present"""
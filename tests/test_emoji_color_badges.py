@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for emoji color badge tone thresholds.
+
+Brute-forces every color whose luminance sits near the black (< 0.08) and
+white (> 0.95) thresholds against the original float implementation.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src/tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'tools'))
+
+from emoji_color_badges import get_color_emoji
+
+# Integer luminance (299R + 587G + 114B) of the two documented thresholds
+BLACK_LIMIT = 20400    # 0.08 * 255000
+WHITE_LIMIT = 242250   # 0.95 * 255000
+WINDOW = 600
+
+
+def colors_near_thresholds():
+    """Yield (r, g, b, luminance) for all colors close to either threshold"""
+    for limit in (BLACK_LIMIT, WHITE_LIMIT):
+        for r in range(256):
+            for g in range(256):
+                base = 299 * r + 587 * g
+                # Blue values putting the luminance within WINDOW of the limit
+                low = max(0, -(-(limit - WINDOW - base) // 114))
+                high = min(255, (limit + WINDOW - base) // 114)
+                for b in range(low, high + 1):
+                    yield r, g, b, base + 114 * b
+
+
+def float_emoji(r, g, b, tones=True):
+    """Original float implementation (tones=False skips the black/white step)"""
+    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    if tones and luminance > 0.95:
+        return '⬜'
+    elif tones and luminance < 0.08:
+        return '⬛'
+
+    if r > b and b > g:
+        return '🟪'
+    if abs(r - b) < 30 and r > g and b > g:
+        return '🟪'
+    if r > g and r > b:
+        if r > 200:
+            return '🟥' if g < 100 else '🟧'
+        return '🟫'
+    elif g > r and g > b:
+        return '🟩'
+    elif b > r and b > g:
+        return '🟦'
+    return '⬛' if luminance < 0.5 else '⬜'
+
+
+def test_tones_match_float_version():
+    """Same emoji as the float version around both thresholds"""
+    for r, g, b, luminance in colors_near_thresholds():
+        if luminance == BLACK_LIMIT:
+            continue  # see test_exact_black_threshold
+        assert get_color_emoji(f'#{r:02x}{g:02x}{b:02x}') == float_emoji(r, g, b), (r, g, b)
+
+
+def test_exact_black_threshold():
+    """Exactly 0.08 is not "< 0.08"; float rounding made some of these black"""
+    for r, g, b, luminance in colors_near_thresholds():
+        if luminance == BLACK_LIMIT:
+            expected = float_emoji(r, g, b, tones=False)
+            assert get_color_emoji(f'#{r:02x}{g:02x}{b:02x}') == expected, (r, g, b)
+
+
+def test_boundary_colors():
+    """Colors on either side of each threshold"""
+    assert get_color_emoji('#000d70') == '⬛'  # 20399, just below 0.08
+    assert get_color_emoji('#e7f9ed') == '🟩'  # 242250, exactly 0.95
+    assert get_color_emoji('#e1fee3') == '⬜'  # 242251, just above 0.95
+
+
+if __name__ == '__main__':
+    test_tones_match_float_version()
+    test_exact_black_threshold()
+    test_boundary_colors()
+    print("✓ Emoji tone threshold tests passed")
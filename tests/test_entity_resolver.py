@@ -5,9 +5,12 @@ Test Entity Resolver
 Tests for the three-tier override system in EntityResolver.
 """
 
+import atexit
 import json
+import shutil
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
@@ -17,56 +20,72 @@ from modules.entity_resolver import EntityResolver
 from modules.entity_models import Location, Organizer
 
 
+# Sample locations library
+LOCATIONS_DATA = {
+    'locations': [
+        {
+            'id': 'loc_theater_hof',
+            'name': 'Theater Hof',
+            'lat': 50.3200,
+            'lon': 11.9180,
+            'address': 'Kulmbacher Str., 95030 Hof',
+            'verified': True
+        },
+        {
+            'id': 'loc_freiheitshalle',
+            'name': 'Freiheitshalle Hof',
+            'lat': 50.3167,
+            'lon': 11.9167,
+            'address': 'Freiheitshalle, Hof'
+        }
+    ]
+}
+
+# Sample organizers library
+ORGANIZERS_DATA = {
+    'organizers': [
+        {
+            'id': 'org_kulturverein',
+            'name': 'Kulturverein Hof',
+            'website': 'https://kulturverein-hof.de',
+            'verified': True
+        }
+    ]
+}
+
+
+@lru_cache(maxsize=None)
 def create_test_environment():
-    """Create temporary test environment with sample data"""
+    """
+    Create temporary test environment with sample data
+    
+    Built once and shared by the file-based tests - EntityResolver only
+    reads it.
+    """
     temp_dir = Path(tempfile.mkdtemp())
+    atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
     
     # Create assets/json directory
     json_dir = temp_dir / 'assets' / 'json'
     json_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create sample locations library
-    locations_data = {
-        'locations': [
-            {
-                'id': 'loc_theater_hof',
-                'name': 'Theater Hof',
-                'lat': 50.3200,
-                'lon': 11.9180,
-                'address': 'Kulmbacher Str., 95030 Hof',
-                'verified': True
-            },
-            {
-                'id': 'loc_freiheitshalle',
-                'name': 'Freiheitshalle Hof',
-                'lat': 50.3167,
-                'lon': 11.9167,
-                'address': 'Freiheitshalle, Hof'
-            }
-        ]
-    }
-    
     with open(json_dir / 'locations.json', 'w', encoding='utf-8') as f:
-        json.dump(locations_data, f, indent=2)
-    
-    # Create sample organizers library
-    organizers_data = {
-        'organizers': [
-            {
-                'id': 'org_kulturverein',
-                'name': 'Kulturverein Hof',
-                'website': 'https://kulturverein-hof.de',
-                'verified': True
-            }
-        ]
-    }
+        json.dump(LOCATIONS_DATA, f, indent=2)
     
     with open(json_dir / 'organizers.json', 'w', encoding='utf-8') as f:
-        json.dump(organizers_data, f, indent=2)
+        json.dump(ORGANIZERS_DATA, f, indent=2)
     
     return temp_dir
 
 
+def create_test_resolver():
+    """Create resolver from the in-memory sample libraries (no file I/O)"""
+    return EntityResolver.from_dicts(
+        LOCATIONS_DATA['locations'],
+        ORGANIZERS_DATA['organizers']
+    )
+
+
 def test_tier1_reference_only():
     """Test Tier 1: Reference only resolution"""
     print("Testing Tier 1: Reference only...")
@@ -101,8 +120,7 @@ def test_tier2_partial_override():
     """Test Tier 2: Partial override resolution"""
     print("Testing Tier 2: Partial override...")
     
-    base_path = create_test_environment()
-    resolver = EntityResolver(base_path)
+    resolver = create_test_resolver()
     
     event = {
         'id': 'event_2',
@@ -137,8 +155,7 @@ def test_tier3_full_override():
     """Test Tier 3: Full override resolution"""
     print("Testing Tier 3: Full override...")
     
-    base_path = create_test_environment()
-    resolver = EntityResolver(base_path)
+    resolver = create_test_resolver()
     
     event = {
         'id': 'event_3',
@@ -169,8 +186,7 @@ def test_resolve_full_event():
     """Test resolving complete event"""
     print("Testing full event resolution...")
     
-    base_path = create_test_environment()
-    resolver = EntityResolver(base_path)
+    resolver = create_test_resolver()
     
     event = {
         'id': 'event_4',
@@ -200,8 +216,7 @@ def test_batch_resolution():
     """Test batch event resolution"""
     print("Testing batch resolution...")
     
-    base_path = create_test_environment()
-    resolver = EntityResolver(base_path)
+    resolver = create_test_resolver()
     
     events = [
         {
@@ -227,8 +242,7 @@ def test_usage_stats():
     """Test location usage statistics"""
     print("Testing usage statistics...")
     
-    base_path = create_test_environment()
-    resolver = EntityResolver(base_path)
+    resolver = create_test_resolver()
     
     events = [
         {'id': 'event_1', 'location_id': 'loc_theater_hof'},
@@ -246,6 +260,31 @@ def test_usage_stats():
     print("✓ Usage statistics test passed")
 
 
+def test_from_dicts_matches_files():
+    """Test that in-memory libraries resolve like the JSON files"""
+    print("Testing from_dicts()...")
+    
+    file_resolver = EntityResolver(create_test_environment())
+    memory_resolver = create_test_resolver()
+    
+    event = {
+        'id': 'event_5',
+        'location_id': 'loc_theater_hof',
+        'location_override': {'name': 'VIP'},
+        'organizer_id': 'org_kulturverein'
+    }
+    
+    assert memory_resolver.resolve_event(event) == file_resolver.resolve_event(event)
+    assert memory_resolver.get_stats() == file_resolver.get_stats()
+    
+    # Resolved entities must not alias the caller's library entries
+    resolved = memory_resolver.resolve_event({'id': 'event_6', 'location_id': 'loc_freiheitshalle'})
+    resolved['location']['name'] = 'Changed'
+    assert LOCATIONS_DATA['locations'][1]['name'] == 'Freiheitshalle Hof'
+    
+    print("✓ from_dicts test passed")
+
+
 def run_all_tests():
     """Run all entity resolver tests"""
     print("=" * 70)
@@ -260,6 +299,7 @@ def run_all_tests():
         test_resolve_full_event,
         test_batch_resolution,
         test_usage_stats,
+        test_from_dicts_matches_files,
     ]
     
     passed = 0
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for the feature verifier's JSON loading, pattern matching and
+on-disk result cache.
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import feature_verifier
+from modules.feature_verifier import FeatureVerifier
+
+
+class TestLoads(unittest.TestCase):
+    """_loads() parses like json.loads()"""
+
+    def test_nan_and_infinity(self):
+        data = feature_verifier._loads(b'{"map": {"zoom": NaN, "max": Infinity}}')
+        self.assertEqual(set(data["map"]), {"zoom", "max"})
+        self.assertEqual(data["map"]["max"], float('inf'))
+
+    def test_big_ints(self):
+        raw = json.dumps({"big": 2 ** 70 + 1}).encode()
+        self.assertEqual(feature_verifier._loads(raw), {"big": 2 ** 70 + 1})
+
+    def test_invalid_json_raises(self):
+        with self.assertRaises(ValueError):
+            feature_verifier._loads(b'{"broken": ')
+
+
+# (pattern, literal branches or None if it needs the regex engine)
+LITERAL_CASES = [
+    (r'foo\.bar', ('foo.bar',)),
+    ('a|b', ('a', 'b')),
+    ('zzz|', ('zzz', '')),
+    (r'\d', None),
+    (r'\b', None),
+    ('(x)', None),
+    ('x{2}', None),
+    ('[ab]', None),
+    ('^x', None),
+]
+
+SAMPLE_CONTENTS = ['foo.bar', 'fooxbar', 'a', 'b', 'zzz', '', '7', 'xx', 'x', ' x', 'nothing']
+
+
+class TestLiteralPatterns(unittest.TestCase):
+    """Literal alternatives take the substring path and match like re.search"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / 'sample.txt'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_literal_alternatives(self):
+        for pattern, expected in LITERAL_CASES:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(FeatureVerifier._literal_alternatives(pattern), expected)
+
+    def test_match_agrees_with_re_search(self):
+        for content in SAMPLE_CONTENTS:
+            self.path.write_text(content, encoding='utf-8')
+            # Fresh verifier so the file content isn't served from its cache
+            verifier = FeatureVerifier(repo_root=self.temp_dir)
+            for pattern, _ in LITERAL_CASES:
+                with self.subTest(pattern=pattern, content=content):
+                    found, _ = verifier._match_pattern(self.path, pattern)
+                    self.assertEqual(found, re.search(pattern, content) is not None)
+
+
+FEATURES = {
+    "features": [
+        {
+            "id": "greeting",
+            "name": "Greeting",
+            "category": "core",
+            "files": ["app.py"],
+            "code_patterns": [
+                {"file": "app.py", "pattern": "def greet"},
+                {"file": "app.py", "pattern": r"print\(.*\)"}
+            ]
+        },
+        {
+            "id": "helpers",
+            "name": "Helpers",
+            "category": "core",
+            "code_patterns": [
+                {"file": "helpers.py", "pattern": "HELPER|helper"}
+            ]
+        }
+    ]
+}
+
+
+class TestResultCache(unittest.TestCase):
+    """The .verify_cache.json result cache never changes the outcome"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = Path(self.temp_dir)
+        (self.repo / 'features.json').write_text(json.dumps(FEATURES), encoding='utf-8')
+        self.app = self.repo / 'app.py'
+        self.app.write_text('def greet():\n    print("hi")\n', encoding='utf-8')
+        (self.repo / 'helpers.py').write_text('HELPER = 1\n', encoding='utf-8')
+        self.cache_file = self.repo / FeatureVerifier.CACHE_FILENAME
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def verify(self, use_cache=True):
+        # verify_all() adds to the verifier's totals, so one instance per run
+        return FeatureVerifier(repo_root=self.repo, use_cache=use_cache).verify_all()
+
+    def statuses(self, results):
+        return [feature['status'] for feature in results['features']]
+
+    def run_cli(self, *args):
+        """Run main() and return what it prints"""
+        argv = ['feature_verifier.py', '--repo-root', str(self.repo), *args]
+        out = io.StringIO()
+        with patch.object(sys, 'argv', argv), redirect_stdout(out):
+            with self.assertRaises(SystemExit):
+                feature_verifier.main()
+        return out.getvalue()
+
+    def write_lying_cache(self, version=FeatureVerifier.CACHE_VERSION):
+        """Store a current-looking entry that claims 'def greet' is missing"""
+        st = os.stat(self.app)
+        data = {
+            'version': version,
+            'files': {
+                'app.py': {
+                    'stamp': [st.st_mtime_ns, st.st_size],
+                    'results': {'def greet': [False, 'pattern not found']}
+                }
+            }
+        }
+        self.cache_file.write_text(json.dumps(data), encoding='utf-8')
+
+    def test_stored_results_are_reused(self):
+        self.write_lying_cache()
+        self.assertEqual(self.statuses(self.verify()), ['failed', 'passed'])
+
+    def test_size_change_invalidates_entry(self):
+        self.verify()
+        self.app.write_text('def farewell_longer():\n    print("hi")\n', encoding='utf-8')
+        self.assertEqual(self.statuses(self.verify()), ['failed', 'passed'])
+
+    def test_mtime_change_invalidates_entry(self):
+        self.verify()
+        st = os.stat(self.app)
+        # Same size, different content and a newer mtime
+        self.app.write_text('def great():\n    print("hi")\n', encoding='utf-8')
+        os.utime(self.app, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(os.stat(self.app).st_size, st.st_size)
+        self.assertEqual(self.statuses(self.verify()), ['failed', 'passed'])
+
+    def test_version_mismatch_is_ignored(self):
+        self.write_lying_cache(version=FeatureVerifier.CACHE_VERSION + 1)
+        self.assertEqual(self.statuses(self.verify()), ['passed', 'passed'])
+        data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        self.assertEqual(data['version'], FeatureVerifier.CACHE_VERSION)
+
+    def test_corrupt_cache_is_ignored(self):
+        for content in ('{"version": 1, "files": ', '[]', '{"version": 1, "files": []}'):
+            with self.subTest(content=content):
+                self.cache_file.write_text(content, encoding='utf-8')
+                self.assertEqual(self.statuses(self.verify()), ['passed', 'passed'])
+                data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+                self.assertEqual(set(data['files']), {'app.py', 'helpers.py'})
+
+    def test_no_cache_never_writes(self):
+        self.verify(use_cache=False)
+        self.run_cli('--no-cache')
+        self.run_cli('--no-cache', '--json')
+        self.assertFalse(self.cache_file.exists())
+
+    def test_no_cache_never_reads(self):
+        self.write_lying_cache()
+        before = self.cache_file.read_bytes()
+        self.assertEqual(self.statuses(self.verify(use_cache=False)), ['passed', 'passed'])
+        output = self.run_cli('--no-cache', '--json')
+        self.assertIn('"passed": 2', output)
+        self.assertNotIn('"status": "failed"', output)
+        self.assertEqual(self.cache_file.read_bytes(), before)
+
+    def test_unchecked_files_are_dropped(self):
+        self.verify()
+        data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        data['files']['removed.py'] = {'stamp': [0, 0], 'results': {'x': [True, None]}}
+        self.cache_file.write_text(json.dumps(data), encoding='utf-8')
+        self.verify()
+        data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        self.assertEqual(set(data['files']), {'app.py', 'helpers.py'})
+
+    def test_cold_warm_and_no_cache_output_identical(self):
+        for args in (('--json',), ()):
+            with self.subTest(args=args):
+                self.cache_file.unlink(missing_ok=True)
+                cold = self.run_cli(*args)
+                self.assertTrue(self.cache_file.exists())
+                warm = self.run_cli(*args)
+                uncached = self.run_cli('--no-cache', *args)
+                self.assertEqual(cold.encode(), warm.encode())
+                self.assertEqual(cold.encode(), uncached.encode())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
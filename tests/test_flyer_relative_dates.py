@@ -45,9 +45,13 @@ def build_source(ai_providers=None, options=None, base_path=None):
     )
 
 
+# Shared by the read-only date parsing tests
+_SOURCE = build_source()
+
+
 def test_relative_date_parsing_from_text():
     """Ensure relative dates in flyer text resolve to concrete datetimes."""
-    source = build_source()
+    source = _SOURCE
     now = datetime.now()
 
     cases = [
@@ -67,7 +71,7 @@ def test_relative_date_parsing_from_text():
 
 def test_month_day_without_year():
     """Handle DD.MM format without year for upcoming month events."""
-    source = build_source()
+    source = _SOURCE
     target_date = datetime.now() + timedelta(days=10)
     text = target_date.strftime("%d.%m.")
 
@@ -156,7 +160,7 @@ def test_post_cache_skips_processed_posts(tmp_path):
 
 def test_mobile_url_conversion():
     """Ensure Facebook URLs are correctly converted to mobile versions without double 'm.' prefixes."""
-    source = build_source()
+    source = _SOURCE
     
     # Test various URL formats
     test_cases = [
@@ -177,7 +181,7 @@ def test_mobile_url_conversion():
 
 def test_mobile_url_conversion_security():
     """Ensure URL conversion uses proper hostname matching to prevent URL substring attacks."""
-    source = build_source()
+    source = _SOURCE
     
     # Test that URLs with facebook.com in the path are NOT modified (security fix)
     malicious_urls = [
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for read_json()/write_json() in utils.py, on both the orjson path
+(when installed) and the stdlib json path.
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import utils
+from modules.utils import read_json, write_json
+
+# Typical entity library content (locations.json / organizers.json)
+SAMPLE_DATA = {
+    "locations": {
+        "loc_freiheitshalle": {
+            "id": "loc_freiheitshalle",
+            "name": "Freiheitshalle Hof",
+            "lat": 50.3167,
+            "lon": 11.9167,
+            "address": "Kulmbacher Straße 4, 95030 Hof",
+            "aliases": ["Freiheitshalle", "Festsaal"],
+            "verified": True,
+            "capacity": 2000,
+            "notes": None,
+            "tags": [],
+            "extra": {}
+        }
+    },
+    "version": "1.0",
+    "emoji": "🎭 Ü"
+}
+
+
+class TestJsonIO(unittest.TestCase):
+    """read_json/write_json round trips and output format"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / 'data.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def expected_bytes(self, data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def test_orjson_output_matches_json(self):
+        """orjson path writes the same bytes as json.dump for entity data"""
+        if not utils.ORJSON_AVAILABLE:
+            self.skipTest("orjson not installed")
+        write_json(self.path, SAMPLE_DATA)
+        self.assertEqual(self.path.read_bytes(), self.expected_bytes(SAMPLE_DATA))
+        self.assertEqual(read_json(self.path), SAMPLE_DATA)
+
+    def test_stdlib_output(self):
+        """Without orjson the output is json.dump's"""
+        with patch.object(utils, 'ORJSON_AVAILABLE', False):
+            write_json(self.path, SAMPLE_DATA)
+            self.assertEqual(read_json(self.path), SAMPLE_DATA)
+        self.assertEqual(self.path.read_bytes(), self.expected_bytes(SAMPLE_DATA))
+
+    def test_orjson_rejected_data_falls_back_to_json(self):
+        """Non-str keys and ints beyond 64 bits are written by json"""
+        data = {1: "one", "big": 2 ** 70}
+        write_json(self.path, data)
+        self.assertEqual(self.path.read_bytes(), self.expected_bytes(data))
+
+    def test_reads_nan_and_infinity_written_by_json(self):
+        """json.dump writes NaN/Infinity; read_json must not reject them"""
+        data = {"pending_events": [{"lat": float('nan'), "lon": float('inf')}]}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        event = read_json(self.path)["pending_events"][0]
+        self.assertNotEqual(event["lat"], event["lat"])  # NaN
+        self.assertEqual(event["lon"], float('inf'))
+
+    def test_big_ints_round_trip(self):
+        """Integers beyond 64 bits keep full precision"""
+        data = {"big": 2 ** 70 + 1, "negative": -2 ** 63 - 1, "max_u64": 2 ** 64 - 1}
+        write_json(self.path, data)
+        loaded = read_json(self.path)
+        self.assertEqual(loaded, data)
+        self.assertIsInstance(loaded["big"], int)
+
+    def test_invalid_json_still_raises(self):
+        """Real syntax errors raise json.JSONDecodeError"""
+        self.path.write_text('{"broken": ', encoding='utf-8')
+        with self.assertRaises(json.JSONDecodeError):
+            read_json(self.path)
+
+    def test_failed_write_keeps_existing_file(self):
+        """A serialization error must not truncate the target file"""
+        write_json(self.path, SAMPLE_DATA)
+        before = self.path.read_bytes()
+        with self.assertRaises(TypeError):
+            write_json(self.path, {"bad": object()})
+        self.assertEqual(self.path.read_bytes(), before)
+
+
+class TestCountPendingEvents(unittest.TestCase):
+    """count_pending_events() agrees with load_pending_events()"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_path = Path(self.temp_dir)
+        self.path = self.base_path / 'assets' / 'json' / 'pending_events.json'
+        self.path.parent.mkdir(parents=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_counts_events(self):
+        data = {"pending_events": [{"id": "a"}, {"id": "b"}]}
+        self.path.write_text(json.dumps(data), encoding='utf-8')
+        self.assertEqual(utils.count_pending_events(self.base_path), 2)
+
+    def test_counts_events_with_nan(self):
+        """NaN written by json.dump trips ijson but is still counted"""
+        data = {"pending_events": [{"id": "a", "lat": float('nan')}, {"id": "b"}]}
+        self.path.write_text(json.dumps(data), encoding='utf-8')
+        self.assertEqual(utils.count_pending_events(self.base_path), 2)
+
+    def test_missing_file_counts_zero(self):
+        self.path.parent.rmdir()
+        self.assertEqual(utils.count_pending_events(self.base_path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
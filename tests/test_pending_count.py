@@ -15,6 +15,9 @@ def test_pending_count_in_events_json():
     """Test that pending count is added to events.json"""
     print("\n=== Testing Pending Count in events.json ===")
     
+    # Step results are collected and written in one go at the end
+    log = []
+    
     # Setup test environment
     test_dir = tempfile.mkdtemp(prefix='krwl_pending_count_test_')
     test_path = Path(test_dir)
@@ -80,27 +83,27 @@ def test_pending_count_in_events_json():
             json.dump({'rejected_events': [], 'last_updated': datetime.now().isoformat()}, f)
         
         # Test 1: Update pending count in events.json
-        print("Test 1: Checking pending_count is added to events.json...")
+        log.append("Test 1: Checking pending_count is added to events.json...")
         update_pending_count_in_events(test_path)
         
         events_data = load_events(test_path)
         if 'pending_count' in events_data:
-            print("✓ pending_count field added to events.json")
+            log.append("✓ pending_count field added to events.json")
         else:
-            print("✗ pending_count field not found in events.json")
+            log.append("✗ pending_count field not found in events.json")
             return False
         
         # Test 2: Pending count value is correct
-        print("Test 2: Checking pending count value...")
+        log.append("Test 2: Checking pending count value...")
         expected_count = 3
         if events_data['pending_count'] == expected_count:
-            print(f"✓ Pending count is correct: {expected_count}")
+            log.append(f"✓ Pending count is correct: {expected_count}")
         else:
-            print(f"✗ Pending count incorrect. Expected {expected_count}, got {events_data['pending_count']}")
+            log.append(f"✗ Pending count incorrect. Expected {expected_count}, got {events_data['pending_count']}")
             return False
         
         # Test 3: Verify timestamp is NOT changed (metadata-only update)
-        print("Test 3: Checking last_updated timestamp remains unchanged...")
+        log.append("Test 3: Checking last_updated timestamp remains unchanged...")
         original_timestamp = events_data.get('last_updated')
         
         # Update pending count again
@@ -109,13 +112,13 @@ def test_pending_count_in_events_json():
         new_timestamp = events_data_after.get('last_updated')
         
         if original_timestamp == new_timestamp:
-            print("✓ last_updated timestamp preserved (correct behavior)")
+            log.append("✓ last_updated timestamp preserved (correct behavior)")
         else:
-            print(f"✗ last_updated changed from {original_timestamp} to {new_timestamp}")
+            log.append(f"✗ last_updated changed from {original_timestamp} to {new_timestamp}")
             return False
         
         # Test 4: Pending count updates when count changes
-        print("Test 4: Checking count updates...")
+        log.append("Test 4: Checking count updates...")
         # Remove one pending event
         pending_events['pending_events'] = pending_events['pending_events'][:2]
         with open(event_data_dir / 'pending_events.json', 'w') as f:
@@ -126,13 +129,13 @@ def test_pending_count_in_events_json():
         events_data = load_events(test_path)
         
         if events_data['pending_count'] == 2:
-            print("✓ Pending count correctly updated to 2")
+            log.append("✓ Pending count correctly updated to 2")
         else:
-            print(f"✗ Pending count not updated. Expected 2, got {events_data['pending_count']}")
+            log.append(f"✗ Pending count not updated. Expected 2, got {events_data['pending_count']}")
             return False
         
         # Test 5: Zero pending events
-        print("Test 5: Checking zero pending events...")
+        log.append("Test 5: Checking zero pending events...")
         pending_events['pending_events'] = []
         with open(event_data_dir / 'pending_events.json', 'w') as f:
             json.dump(pending_events, f, indent=2)
@@ -141,13 +144,13 @@ def test_pending_count_in_events_json():
         events_data = load_events(test_path)
         
         if events_data['pending_count'] == 0:
-            print("✓ Pending count correctly shows 0")
+            log.append("✓ Pending count correctly shows 0")
         else:
-            print(f"✗ Pending count incorrect for empty. Expected 0, got {events_data['pending_count']}")
+            log.append(f"✗ Pending count incorrect for empty. Expected 0, got {events_data['pending_count']}")
             return False
         
         # Test 6: Scraper integration test
-        print("Test 6: Checking scraper integration...")
+        log.append("Test 6: Checking scraper integration...")
         # Add pending events back
         pending_events['pending_events'] = [
             {
@@ -174,15 +177,16 @@ def test_pending_count_in_events_json():
         # Check that pending count was updated by scraper
         events_data = load_events(test_path)
         if events_data['pending_count'] == 1:
-            print("✓ Scraper correctly updated pending count")
+            log.append("✓ Scraper correctly updated pending count")
         else:
-            print(f"✗ Scraper didn't update count. Expected 1, got {events_data['pending_count']}")
+            log.append(f"✗ Scraper didn't update count. Expected 1, got {events_data['pending_count']}")
             return False
         
-        print("\n✓ All pending count tests passed")
+        log.append("\n✓ All pending count tests passed")
         return True
         
     finally:
+        sys.stdout.write('\n'.join(log) + '\n')
         # Cleanup
         shutil.rmtree(test_dir, ignore_errors=True)
 
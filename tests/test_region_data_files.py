@@ -7,12 +7,102 @@ All regions share the same event data - no data splitting by region.
 """
 
 import json
+import os
+import stat
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from modules.utils import read_json
+
+# Optional: ijson validates events.json incrementally, so the tests only keep
+# the event count and a few sample events instead of the whole list.
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+# Number of leading events checked by the schema test
+SAMPLE_SIZE = 5
+
+# Fields every event should have, in the order they are reported
+REQUIRED_EVENT_FIELDS = ('id', 'title', 'start_time', 'location')
+REQUIRED_EVENT_FIELD_SET = frozenset(REQUIRED_EVENT_FIELDS)
+
+
+def summarize_events(data):
+    """
+    Summarize parsed events.json data.
+    
+    Returns a dict with 'format' ('array', 'object' or None if neither),
+    'events_is_list', 'count' and the first SAMPLE_SIZE events as 'sample'.
+    """
+    if isinstance(data, list):
+        fmt, events = 'array', data
+    elif isinstance(data, dict) and 'events' in data:
+        fmt, events = 'object', data['events']
+    else:
+        return {'format': None, 'events_is_list': False, 'count': 0, 'sample': []}
+    
+    if not isinstance(events, list):
+        return {'format': fmt, 'events_is_list': False, 'count': 0, 'sample': []}
+    return {'format': fmt, 'events_is_list': True, 'count': len(events),
+            'sample': events[:SAMPLE_SIZE]}
+
+
+def stream_summarize_events(f):
+    """
+    Same result as summarize_events(json.load(f)), built from ijson parse
+    events so only the sample events are ever materialized.
+    """
+    summary = {'format': None, 'events_is_list': False, 'count': 0, 'sample': []}
+    depth = 0          # containers open around the current event
+    key = None         # current key of a top-level object
+    item_depth = None  # depth of event items while inside the events array
+    builder = None     # builds the sample event currently being parsed
+    
+    for _, event, value in ijson.parse(f):
+        is_end = event in ('end_map', 'end_array')
+        if is_end:
+            depth -= 1
+        
+        if builder is not None:
+            builder.event(event, value)
+            if depth == item_depth:
+                summary['sample'].append(builder.value)
+                builder = None
+        elif item_depth is not None and depth == item_depth - 1:
+            item_depth = None  # end of the events array
+        elif item_depth is not None and depth == item_depth and not is_end:
+            summary['count'] += 1
+            if len(summary['sample']) < SAMPLE_SIZE:
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    summary['sample'].append(value)
+        elif depth == 0 and event == 'start_array':
+            summary.update(format='array', events_is_list=True)
+            item_depth = 1
+        elif depth == 1 and event == 'map_key':
+            key = value
+        elif depth == 1 and key == 'events' and not is_end:
+            # A repeated "events" key replaces the earlier one, as in json.load
+            is_list = event == 'start_array'
+            summary.update(format='object', events_is_list=is_list, count=0, sample=[])
+            if is_list:
+                item_depth = 2
+        
+        if event in ('start_map', 'start_array'):
+            depth += 1
+    
+    return summary
+
 
 class TestRegionDataFiles:
     """Test suite for shared event data file (regions share same data)"""
@@ -24,28 +114,60 @@ class TestRegionDataFiles:
         self.errors = []
         self.warnings = []
         self.config = None
+        # (path, exists) of events.json, resolved once for all tests
+        self._main_events_location = None
+        # events.json summary (or the exception raised), shared by the tests
+        self._main_events_cache = None
     
     def load_config(self):
         """Load config to get region list"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = read_json(self.config_path)
             return True
         except Exception as e:
             self.errors.append(f"Failed to load config: {e}")
             return False
     
+    def locate_main_events(self):
+        """Resolve the shared events.json and check that it exists, once"""
+        if self._main_events_location is None:
+            main_events = self.base_path / "assets" / "json" / "events.json"
+            self._main_events_location = (main_events, main_events.exists())
+        return self._main_events_location
+    
+    def load_main_events(self):
+        """Summarize the shared events.json once (re-raises parse errors)"""
+        if self._main_events_cache is None:
+            main_events, _ = self.locate_main_events()
+            try:
+                if IJSON_AVAILABLE:
+                    with open(main_events, 'rb') as f:
+                        summary = stream_summarize_events(f)
+                else:
+                    summary = summarize_events(read_json(main_events))
+                self._main_events_cache = (summary, None)
+            except Exception as e:
+                self._main_events_cache = (None, e)
+        
+        summary, error = self._main_events_cache
+        if error is not None:
+            raise error
+        return summary
+    
     def test_events_directory_exists(self):
         """Test that events directory exists (for archived events)"""
         print("  Testing: Events directory exists (for archived events)...")
         
         # Note: This directory is for archived events, not region-specific data
         # All regions share the main events.json file
-        if not self.events_dir.exists():
+        # One stat answers both "exists" and "is a directory"
+        try:
+            mode = os.stat(self.events_dir).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             self.warnings.append(f"Events directory not found: {self.events_dir} (will be created when archiving)")
             return True
         
-        if not self.events_dir.is_dir():
+        if not stat.S_ISDIR(mode):
             self.errors.append(f"Events path is not a directory: {self.events_dir}")
             return False
         
@@ -81,8 +203,8 @@ class TestRegionDataFiles:
             )
         
         # Check that main events.json exists
-        main_events = self.base_path / "assets" / "json" / "events.json"
-        if not main_events.exists():
+        main_events, exists = self.locate_main_events()
+        if not exists:
             self.errors.append(f"Main events.json not found: {main_events}")
             all_valid = False
         else:
@@ -94,33 +216,30 @@ class TestRegionDataFiles:
         """Test that shared events.json is valid JSON"""
         print("  Testing: Shared events.json is valid JSON...")
         
-        main_events = self.base_path / "assets" / "json" / "events.json"
+        _, exists = self.locate_main_events()
         
-        if not main_events.exists():
+        if not exists:
             self.errors.append("Main events.json not found")
             return False
         
         try:
-            with open(main_events, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            summary = self.load_main_events()
             
             # Check structure - can be array or object with "events" key
-            if isinstance(data, list):
-                events = data
-                print(f"    ✓ events.json: {len(events)} events (array format)")
-            elif isinstance(data, dict) and 'events' in data:
-                events = data['events']
-                if not isinstance(events, list):
+            if summary['format'] == 'array':
+                print(f"    ✓ events.json: {summary['count']} events (array format)")
+            elif summary['format'] == 'object':
+                if not summary['events_is_list']:
                     self.errors.append("events.json 'events' field must be an array")
                     return False
-                print(f"    ✓ events.json: {len(events)} events (object format, shared by all regions)")
+                print(f"    ✓ events.json: {summary['count']} events (object format, shared by all regions)")
             else:
                 self.errors.append("events.json must be array or object with 'events' key")
                 return False
             
             return True
         
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             self.errors.append(f"Invalid JSON in events.json: {e}")
             return False
         except Exception as e:
@@ -131,39 +250,29 @@ class TestRegionDataFiles:
         """Test that events have basic required fields"""
         print("  Testing: Events have basic schema...")
         
-        main_events = self.base_path / "assets" / "json" / "events.json"
+        _, exists = self.locate_main_events()
         
-        if not main_events.exists():
+        if not exists:
             return True  # Already caught in previous test
         
         all_valid = True
-        required_fields = ['id', 'title', 'start_time', 'location']
         
         try:
-            with open(main_events, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Handle both array and object format
-            if isinstance(data, list):
-                events = data
-            elif isinstance(data, dict) and 'events' in data:
-                events = data['events']
-            else:
-                return True  # Already caught in previous test
+            summary = self.load_main_events()
             
-            if not isinstance(events, list):
+            if not summary['events_is_list']:
                 return True  # Already caught in previous test
             
             # Check first few events for schema
-            sample_size = min(5, len(events))
-            for i, event in enumerate(events[:sample_size]):
+            for i, event in enumerate(summary['sample']):
                 if not isinstance(event, dict):
                     self.errors.append(f"Event {i} is not a dictionary")
                     all_valid = False
                     continue
                 
-                missing = [f for f in required_fields if f not in event]
-                if missing:
+                missing_set = REQUIRED_EVENT_FIELD_SET - event.keys()
+                if missing_set:
+                    missing = [f for f in REQUIRED_EVENT_FIELDS if f in missing_set]
                     self.warnings.append(
                         f"Event {i} (id: {event.get('id', 'unknown')}) missing: {', '.join(missing)}"
                     )
@@ -181,31 +290,29 @@ class TestRegionDataFiles:
         """Test that main events.json still exists for backward compatibility"""
         print("  Testing: Backward compatibility - main events.json...")
         
-        main_events = self.base_path / "assets" / "json" / "events.json"
+        _, exists = self.locate_main_events()
         
-        if not main_events.exists():
+        if not exists:
             self.warnings.append(
                 "Main events.json not found - may break backward compatibility"
             )
             return True
         
         try:
-            with open(main_events, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            summary = self.load_main_events()
             
             # Handle both formats
-            if isinstance(data, list):
-                print(f"    ✓ Main events.json exists ({len(data)} events, array format)")
-            elif isinstance(data, dict) and 'events' in data:
-                events = data['events']
-                if isinstance(events, list):
-                    print(f"    ✓ Main events.json exists ({len(events)} events, object format)")
+            if summary['format'] == 'array':
+                print(f"    ✓ Main events.json exists ({summary['count']} events, array format)")
+            elif summary['format'] == 'object':
+                if summary['events_is_list']:
+                    print(f"    ✓ Main events.json exists ({summary['count']} events, object format)")
                 else:
                     self.warnings.append("Main events.json 'events' field should be an array")
             else:
                 self.warnings.append("Main events.json has unexpected structure")
         
-        except json.JSONDecodeError:
+        except JSON_ERRORS:
             self.warnings.append("Main events.json has invalid JSON")
         
         return True
@@ -253,26 +360,24 @@ class TestRegionDataFiles:
     
     def print_results(self):
         """Print test results"""
-        print("\n" + "="*60)
-        print("Test Results")
-        print("="*60)
+        # Collected and written in one go rather than line by line
+        lines = ["\n" + "="*60, "Test Results", "="*60]
         
         if self.errors:
-            print(f"\n❌ ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  • {error}")
+            lines.append(f"\n❌ ERRORS ({len(self.errors)}):")
+            lines.extend(f"  • {error}" for error in self.errors)
         
         if self.warnings:
-            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  • {warning}")
+            lines.append(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            lines.extend(f"  • {warning}" for warning in self.warnings)
         
         if not self.errors and not self.warnings:
-            print("\n✅ All tests passed!")
+            lines.append("\n✅ All tests passed!")
         elif not self.errors:
-            print("\n✅ All tests passed (with warnings)")
+            lines.append("\n✅ All tests passed (with warnings)")
         
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
 
 def main():